@@ -0,0 +1,41 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from yay_gui import parse_si_records  # noqa: E402
+
+
+SI_OUTPUT = (
+    'Repository      : extra\n'
+    'Name            : firefox\n'
+    'Version         : 130.0-1\n'
+    'Description     : Fast, Private & Safe Web Browser – ünïcode\n'
+    'URL             : https://www.mozilla.org/firefox/\n'
+    '\n'
+    '\x1b[1mRepository      :\x1b[0m aur\n'
+    '\x1b[1mName            :\x1b[0m yay\n'
+    '\x1b[1mDescription     :\x1b[0m Yet another yogurt\r\n'
+    '\x1b[1mURL             :\x1b[0m \x9b1mhttps://github.com/Jguer/yay\n'
+    '\n'
+    'Name            : nourl\n'
+    'Description     : None given\n'
+)
+
+EXPECTED = {
+    'firefox': ('Fast, Private & Safe Web Browser – ünïcode', 'https://www.mozilla.org/firefox/'),
+    'yay': ('Yet another yogurt', 'https://github.com/Jguer/yay'),
+    'nourl': ('None given', ''),
+}
+
+
+def test_text_and_bytes_give_same_records():
+    raw = SI_OUTPUT.encode('utf-8')
+    assert parse_si_records(SI_OUTPUT) == EXPECTED
+    assert parse_si_records(raw) == EXPECTED
+    assert parse_si_records(bytearray(raw)) == EXPECTED
+
+
+def test_empty_output():
+    assert parse_si_records('') == {}
+    assert parse_si_records(b'  \n') == {}
@@ -0,0 +1,93 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from yay_gui import parse_yay_installed, parse_yay_search, parse_yay_updates  # noqa: E402
+
+
+def test_search_headers_and_descriptions():
+    out = (
+        'extra/firefox 130.0-1 (Installed)\n'
+        '    Fast browser\n'
+        '    second line\n'
+        'aur/yay 12.3.5-1 (+2079 13.61) \n'
+        '    Yet another yogurt\n'
+    )
+    assert parse_yay_search(out) == [
+        {'repo': 'extra', 'name': 'firefox', 'version': '130.0-1 (Installed)',
+         'description': 'Fast browser second line'},
+        {'repo': 'aur', 'name': 'yay', 'version': '12.3.5-1 (+2079 13.61)',
+         'description': 'Yet another yogurt'},
+    ]
+
+
+def test_search_skips_banners_and_blank_lines():
+    out = ':: Searching AUR...\nextra/a 1-1\n    d1\n\n    d2\n:: Searching repos\naur/b 2-1\n    e\n'
+    assert parse_yay_search(out) == [
+        {'repo': 'extra', 'name': 'a', 'version': '1-1', 'description': 'd1 d2'},
+        {'repo': 'aur', 'name': 'b', 'version': '2-1', 'description': 'e'},
+    ]
+
+
+def test_search_crlf():
+    out = 'extra/a 1-1\r\n    d1\r\n\r\n    d2\r\naur/b 2\r\n    e\r\n'
+    assert parse_yay_search(out) == [
+        {'repo': 'extra', 'name': 'a', 'version': '1-1', 'description': 'd1 d2'},
+        {'repo': 'aur', 'name': 'b', 'version': '2', 'description': 'e'},
+    ]
+
+
+def test_search_orphan_descriptions_are_dropped():
+    out = '    orphan\nextra/a 1-1\n    d\nnoise line\n    after noise\naur/b 2\n'
+    assert parse_yay_search(out) == [
+        {'repo': 'extra', 'name': 'a', 'version': '1-1', 'description': 'd'},
+        {'repo': 'aur', 'name': 'b', 'version': '2', 'description': ''},
+    ]
+
+
+def test_search_escape_codes():
+    out = (
+        '\x1b[1m\x1b[35mextra/\x1b[39ma\x1b[0m \x1b[32m1-1\x1b[0m\n'
+        '    \x1b]8;;http://x\x1b\\d\x1b]8;;\x1b\\\n'
+        '\x9b1maur/b\x9b0m 2\n'
+        '    \x9b32me\x9b0m\n'
+    )
+    assert parse_yay_search(out) == [
+        {'repo': 'extra', 'name': 'a', 'version': '1-1', 'description': 'd'},
+        {'repo': 'aur', 'name': 'b', 'version': '2', 'description': 'e'},
+    ]
+
+
+def test_search_empty():
+    assert parse_yay_search('') == []
+    assert parse_yay_search('  \n\n') == []
+
+
+def test_installed():
+    out = 'firefox 130.0-1\r\n  yay 12.3.5-1 extra\nlonely\n\n\x1b[1mb\x1b[0m 2\n\x9b1mc\x9b0m 3\n'
+    assert parse_yay_installed(out) == [
+        {'name': 'firefox', 'version': '130.0-1'},
+        {'name': 'yay', 'version': '12.3.5-1'},
+        {'name': 'b', 'version': '2'},
+        {'name': 'c', 'version': '3'},
+    ]
+    assert parse_yay_installed('') == []
+
+
+def test_updates():
+    out = (
+        ':: Checking for updates\n'
+        'a 1 -> 2\r\n'
+        '  b 1.0-1 -> 1.1-1  \n'
+        'held 1.0-1 -> 2.0-1 [ignored]\n'
+        '\x1b[1mc\x1b[0m \x1b[31m1\x1b[0m -> \x1b[32m2\x1b[0m\n'
+        '\x9b1md\x9b0m 1 -> 2\n'
+    )
+    assert parse_yay_updates(out) == [
+        {'name': 'a', 'old': '1', 'new': '2'},
+        {'name': 'b', 'old': '1.0-1', 'new': '1.1-1'},
+        {'name': 'c', 'old': '1', 'new': '2'},
+        {'name': 'd', 'old': '1', 'new': '2'},
+    ]
+    assert parse_yay_updates('') == []
@@ -2,26 +2,30 @@
 import sys
 import os
 import re
+import shlex
 import shutil
 import subprocess
-import shlex
+import functools
+import html
+import json
+import time
+import traceback
+from collections import OrderedDict
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QPushButton, QTreeWidget, QTreeWidgetItem,
+    QLineEdit, QPushButton, QTreeWidget, QTreeWidgetItem, QTreeWidgetItemIterator,
     QMessageBox, QStatusBar, QHeaderView, QTextEdit,
     QTabWidget, QFrame, QLabel,
     QComboBox, QCheckBox, QFileDialog, QToolButton, QDialog, QSlider, QSpinBox,
     QShortcut
 )
-from PyQt5.QtCore import Qt, QProcess, QSettings, QSize, QTimer
+from PyQt5.QtCore import Qt, QProcess, QProcessEnvironment, QSettings, QSize, QTimer
 from PyQt5.QtGui import QIcon, QKeySequence
 
 
 # ---- Crash logging ----
 def _install_exception_hook():
-    import traceback
-
     def handle_exception(exc_type, exc_value, exc_tb):
         log_path = "/tmp/yay_gui_error.log"
         try:
@@ -42,124 +46,423 @@ def _install_exception_hook():
 # ---- Helpers ----
 # Compile once for speed: stripping ANSI control codes is used on every line
 _ANSI_RE = re.compile(
-    r"\x1B("               # ESC
+    r"\x1B(?:"             # ESC
     r"\[[0-?]*[ -/]*[@-~]"  # CSI sequence
     r"|\][^\x07\x1B]*(?:\x07|\x1B\\)"  # OSC sequence terminated by BEL or ST
     r"|[@-Z\\-_]"           # 2-char sequences
     r")"
+    r"|\x9B[0-?]*[ -/]*[@-~]"  # 8-bit CSI
+)
+# Colored yay/pacman output only ever uses CSI (SGR) sequences; this much
+# smaller pattern handles that case
+_CSI_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+# The 7-bit (ESC) part of _ANSI_RE for raw process bytes, so escape codes are
+# dropped before decoding. 8-bit CSI cannot be matched here: 0x9b is also a
+# UTF-8 continuation byte, so that case stays with clean_control_codes.
+_ANSI_RE_B = re.compile(
+    rb"\x1B(?:"
+    rb"\[[0-?]*[ -/]*[@-~]"
+    rb"|\][^\x07\x1B]*(?:\x07|\x1B\\)"
+    rb"|[@-Z\\-_]"
+    rb")"
 )
+# Accent color field validation (#RRGGBB), checked on every edit
+_ACCENT_RE = re.compile(r'^#[0-9a-fA-F]{6}$')
+# Shared stand-in for an unset name set in hot loops (no per-call allocation)
+_EMPTY = frozenset()
 
 def clean_control_codes(text: str) -> str:
     """Strip ANSI escape sequences including OSC8 hyperlinks."""
+    # Most --color=never output has no ESC or 8-bit CSI at all; skip the regex then
+    if '\x1b' not in text and '\x9b' not in text:
+        return text
+    # Every ESC starts a CSI: no OSC links or other escapes to look for
+    if '\x9b' not in text and text.count('\x1b') == text.count('\x1b['):
+        return _CSI_RE.sub('', text)
     return _ANSI_RE.sub('', text)
 
 
+def read_complete_lines(proc, final: bool = False, errors: str = 'replace'):
+    """Read every complete line buffered on a QProcess, decoded.
+
+    Qt keeps a partial trailing line (or a multi-byte character split across
+    reads) in its own buffer until the newline arrives. With final=True the
+    unterminated tail is returned too, for use once the process has exited.
+    The returned lines are already free of control codes: ESC sequences are
+    stripped from the raw bytes, before decoding.
+    """
+    lines = []
+    strip = _ANSI_RE_B.sub
+    while proc.canReadLine():
+        raw = bytes(proc.readLine())
+        if b'\x1b' in raw:
+            raw = strip(b'', raw)
+        lines.append(raw.decode('utf-8', errors=errors).rstrip('\n'))
+    if final:
+        tail = bytes(proc.readAll())
+        if b'\x1b' in tail:
+            tail = strip(b'', tail)
+        if tail:
+            lines.append(tail.decode('utf-8', errors=errors))
+    # Only a stray 8-bit CSI can be left; check the chunk once instead of
+    # running clean_control_codes on every line
+    if lines:
+        chunk = '\n'.join(lines)
+        if '\x1b' in chunk or '\x9b' in chunk:
+            lines = clean_control_codes(chunk).split('\n')
+    return lines
+
+
+# Whole-output tokenizer for parse_yay_search: banner, indented description,
+# header, the bare CR left of a CRLF blank line, or any other line; lastgroup
+# is 'banner', 'desc', 'ver', 'blank' or 'other'
+_SEARCH_TOKEN_RE = re.compile(
+    r'^(?:(?P<banner>::.*)'
+    r'| (?P<desc>.*)'
+    r'|(?P<repo>[^/\s]+)/(?P<name>\S+)[ \t]+(?P<ver>.+)'
+    r'|(?P<blank>\r)'
+    r'|(?P<other>.+))$',
+    re.M | re.ASCII
+)
+# "repo/name version [flags]" header or ":: ..." banner for the streaming
+# search, told apart by one match (see lastgroup). re.ASCII: yay only pads
+# with ASCII whitespace, so \s/\S skip the Unicode category lookups.
+_SEARCH_LINE_RE = re.compile(
+    r'(?P<banner>::)|(?P<repo>[^/\s]+)/(?P<name>\S+)\s+(?P<ver>.+)$',
+    re.ASCII
+)
+
+
 def parse_yay_search(output: str):
+    """Parse `-Ss` output into package dicts."""
+    if not output or output.isspace():
+        return []
     packages = []
     current = None
-    header_re = re.compile(r'^(?P<repo>[^/\s]+)/(?P<name>\S+)\s+(?P<ver>.+)$')
-    for raw in output.splitlines():
-        line = clean_control_codes(raw)
-        if not line or line.startswith('::'):
+    # Strip escape codes once, then let one finditer tokenize every line;
+    # lastgroup says which kind of line matched (blank lines never match)
+    for m in _SEARCH_TOKEN_RE.finditer(clean_control_codes(output)):
+        kind = m.lastgroup
+        if kind == 'banner' or kind == 'blank':
             continue
-        m = header_re.match(line)
-        if m:
+        if kind == 'desc':
             if current:
-                packages.append(current)
-            current = {
-                'repo': m.group('repo'),
-                'name': m.group('name'),
-                'version': m.group('ver').strip(),
-                'description': ''
-            }
-            continue
-        if line.startswith(' ') and current:
-            current['description'] += line.strip() + ' '
+                current['description'].append(m.group('desc').strip())
             continue
         if current:
             packages.append(current)
             current = None
+        if kind != 'ver':
+            # Unrecognized line: ends the package, later descriptions are orphans
+            continue
+        # Description lines are collected in a list and joined once below
+        current = {
+            'repo': m.group('repo'),
+            'name': m.group('name'),
+            'version': m.group('ver').strip(),
+            'description': []
+        }
     if current:
         packages.append(current)
     for p in packages:
-        p['description'] = p['description'].strip()
+        p['description'] = ' '.join(p['description'])
     return packages
 
 
 def parse_yay_installed(output: str):
+    if not output or output.isspace():
+        return []
     packages = []
-    for raw in output.splitlines():
-        line = clean_control_codes(raw).strip()
-        if not line:
-            continue
-        parts = line.split()
+    # Strip escape codes once for the whole output, not per line
+    for line in clean_control_codes(output).splitlines():
+        parts = line.split(None, 2)
         if len(parts) >= 2:
             packages.append({'name': parts[0], 'version': parts[1]})
     return packages
 
 
+# One "name old -> new" row per line; [ \t] keeps matches from spanning lines
+_UPD_RE = re.compile(
+    r'^[ \t]*(?P<name>\S+)[ \t]+(?P<old>\S+)[ \t]+->[ \t]+(?P<new>\S+)[ \t]*\r?$',
+    re.M | re.ASCII
+)
+
+
 def parse_yay_updates(output: str):
     """Parse lines like: 'pkg 1.0-1 -> 1.1-1' into dicts."""
-    packages = []
-    upd_re = re.compile(r'^(?P<name>\S+)\s+(?P<old>\S+)\s+->\s+(?P<new>\S+)\s*$')
-    for raw in output.splitlines():
-        line = clean_control_codes(raw).strip()
-        if not line or line.startswith('::'):
-            continue
-        m = upd_re.match(line)
-        if m:
-            packages.append({
-                'name': m.group('name'),
-                'old': m.group('old'),
-                'new': m.group('new')
-            })
-    return packages
+    # Up-to-date systems produce no output at all; skip cleaning and scanning
+    if not output or output.isspace():
+        return []
+    # Single findall over the whole (cleaned) output; it yields (name, old, new)
+    # tuples directly, with no match object or group lookups per row
+    return [
+        {'name': name, 'old': old, 'new': new}
+        for name, old, new in _UPD_RE.findall(clean_control_codes(output))
+    ]
+
+
+# Sidebar layout for one package; fields are HTML-escaped before formatting
+_SIDEBAR_HTML = (
+    '<h3>{name}</h3>'
+    '<p>{desc}</p>'
+    '<p><b>Repo:</b> {repo} &nbsp; <b>Version:</b> {version}{link}</p>'
+)
+# The {link} part, only filled in when the package has a URL
+_SIDEBAR_LINK = ' &nbsp; <b>URL:</b> <a href="{0}">{0}</a>'
+
+
+# Blank line between the records of a multi-package -Si
+_SI_RECORD_SPLIT_RE = re.compile(r'\n[ \t]*\r?\n')
+# The only -Si fields we use; one C-level scan finds them all
+_SI_FIELD_RE = re.compile(
+    r'^[ \t]*(?P<key>Name|Description|URL)[ \t]*:[ \t]*(?P<val>\S.*?)[ \t]*\r?$',
+    re.M | re.I
+)
+
 
+def _si_fields(text: str):
+    """Map lowercased field name -> first non-empty value in one -Si record."""
+    fields = {}
+    for m in _SI_FIELD_RE.finditer(clean_control_codes(text)):
+        fields.setdefault(m.group('key').lower(), m.group('val'))
+    return fields
 
-def parse_si_desc_url(output: str):
-    """Extract Description and URL from `pacman -Si` / `yay -Si` output.
 
-    Returns a tuple (description, url). Missing fields return as empty strings.
+def parse_si_records(output):
+    """Split multi-package `-Si` output into {name: (description, url)}.
+
+    Accepts the decoded text or the raw bytes collected from the process;
+    bytes are decoded once and then parsed exactly like text.
     """
-    desc = ''
-    url = ''
-    for raw in output.splitlines():
-        line = clean_control_codes(raw).strip()
-        if not line or ':' not in line:
-            continue
-        # Split only on the first ':' to preserve values that contain ':'
-        key, val = line.split(':', 1)
-        key = key.strip().lower()
-        val = val.strip()
-        if key == 'description' and val:
-            desc = val
-        elif key == 'url' and val:
-            url = val
-    return desc, url
+    records = {}
+    if not output or output.isspace():
+        return records
+    if isinstance(output, (bytes, bytearray)):
+        output = bytes(output).decode('utf-8', errors='replace')
+    for block in _SI_RECORD_SPLIT_RE.split(output):
+        fields = _si_fields(block)
+        if fields.get('name'):
+            records[fields['name']] = (fields.get('description', ''), fields.get('url', ''))
+    return records
 
 
-class TerminalLauncher:
+def preview_names(names, limit: int = 10) -> str:
+    """Space-joined names for confirmation dialogs, cut after `limit` entries."""
+    shown = ' '.join(names[:limit])
+    if len(names) > limit:
+        shown += f' … (+{len(names) - limit} more)'
+    return shown
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str):
+    """shutil.which() memoized per name; avoids re-walking $PATH on every launch."""
+    return shutil.which(name)
+
+
+PACMAN_LOCAL_DB = '/var/lib/pacman/local'
+
+
+def read_local_db_names(path: str = PACMAN_LOCAL_DB):
+    """Return the set of installed package names from pacman's local DB.
+
+    Every installed package has a ``name-pkgver-pkgrel`` directory there, and
+    neither pkgver nor pkgrel may contain a dash, so the name is everything
+    before the last two. Returns None if the directory cannot be read.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {
+                e.name.rsplit('-', 2)[0]
+                for e in entries
+                if e.name.count('-') >= 2 and e.is_dir()
+            }
+    except OSError:
+        return None
+
+
+SI_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'yay-gui', 'si-cache.json'
+)
+
+
+def load_si_cache(path: str = SI_CACHE_PATH):
+    """Read saved -Si results as an OrderedDict of key -> (desc, url, version).
+
+    A missing or unreadable file just means an empty cache.
+    """
+    cache = OrderedDict()
+    try:
+        with open(path, encoding='utf-8') as f:
+            saved = json.load(f)
+        for key, (desc, url, version) in saved.items():
+            cache[key] = (desc, url, version)
+    except (OSError, ValueError, TypeError, AttributeError):
+        return OrderedDict()
+    return cache
+
+
+def save_si_cache(cache, path: str = SI_CACHE_PATH):
+    """Write the -Si cache atomically (temp file + rename)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+def _terminal_env():
+    """Environment for launched terminals, without askpass helpers.
+
+    Returns None (inherit as-is) when neither variable is set, which is the
+    common case, so no copy of os.environ is made.
+    """
+    if 'SUDO_ASKPASS' not in os.environ and 'SSH_ASKPASS' not in os.environ:
+        return None
+    return {k: v for k, v in os.environ.items() if k not in ('SUDO_ASKPASS', 'SSH_ASKPASS')}
+
+
+@functools.lru_cache(maxsize=1)
+def _query_env():
+    """Environment for the pacman/yay query processes, built once.
+
+    COLUMNS is pinned wide so an exported narrow value can't make pacman wrap
+    descriptions onto extra lines; NO_COLOR backs up the --color flags.
+    """
+    env = QProcessEnvironment.systemEnvironment()
+    env.insert('NO_COLOR', '1')
+    env.insert('COLUMNS', '1000')
+    return env
+
+
+def _start_detached(args, env=None):
+    """Start a terminal fully detached (reparented to init).
+
+    The GUI keeps no pipe or child handle, so nothing is left to reap or
+    pump while the terminal runs. env=None inherits our environment.
+    """
+    proc = QProcess()
+    proc.setProgram(args[0])
+    proc.setArguments(list(args[1:]))
+    if env is not None:
+        qenv = QProcessEnvironment()
+        for k, v in env.items():
+            qenv.insert(k, v)
+        proc.setProcessEnvironment(qenv)
+    ok, _pid = proc.startDetached()
+    if not ok:
+        raise RuntimeError(f'Failed to start {args[0]}.')
+
+
+class PackageTable:
+    """Search-result packages stored as parallel columns.
+
+    Tree items keep only the row index (Qt.UserRole on column 1). Storing a
+    dict there made Qt convert it to and from a QVariantMap on every set and
+    read, and the dict handed back was a copy, so fetched details written
+    into it were lost.
+    """
+
     def __init__(self):
-        self.detected = self._detect_terminal()
-
-    def _detect_terminal(self):
-        # Always prefer Konsole when available (ignore $TERMINAL if it is alacritty)
-        if shutil.which('konsole'):
-            return 'konsole'
-
-        term_env = os.environ.get('TERMINAL')
-        if term_env and shutil.which(term_env) and os.path.basename(term_env).lower() != 'alacritty':
-            return term_env
-
-        # Fallbacks, explicitly excluding alacritty per user request
-        for name in (
-            'kitty', 'xfce4-terminal', 'gnome-terminal', 'kgx',
-            'xterm', 'tilix', 'foot', 'wezterm'
-        ):
-            if shutil.which(name):
-                return name
+        self.clear()
+
+    def clear(self):
+        self.names = []
+        self.repos = []
+        self.versions = []
+        self.keys = []  # 'repo/name', the sidebar and -Si cache key
+        self.descs = []
+        self.urls = []
+
+    def add(self, repo: str, name: str, version: str) -> int:
+        # Only a handful of distinct repo names across thousands of rows
+        repo = sys.intern(repo)
+        self.names.append(name)
+        self.repos.append(repo)
+        self.versions.append(version)
+        self.keys.append(sys.intern(f"{repo.lower()}/{name}"))
+        self.descs.append('')
+        self.urls.append('')
+        return len(self.names) - 1
+
+    def version_of(self, idx) -> str:
+        """Bare version token; AUR rows also carry votes and popularity."""
+        parts = self.versions[idx].split(None, 1)
+        return parts[0] if parts else ''
+
+    def index_of(self, item):
+        """Row index stored on a tree item, or None if it has none."""
+        idx = item.data(1, Qt.UserRole)
+        if isinstance(idx, int) and 0 <= idx < len(self.names):
+            return idx
         return None
 
+
+@functools.lru_cache(maxsize=1)
+def _detect_terminal():
+    """Pick the terminal emulator to launch; resolved once per process."""
+    # Always prefer Konsole when available (ignore $TERMINAL if it is alacritty)
+    if _which('konsole'):
+        return 'konsole'
+
+    term_env = os.environ.get('TERMINAL')
+    if term_env and _which(term_env) and os.path.basename(term_env).lower() != 'alacritty':
+        return term_env
+
+    # Fallbacks, explicitly excluding alacritty per user request
+    for name in (
+        'kitty', 'xfce4-terminal', 'gnome-terminal', 'kgx',
+        'xterm', 'tilix', 'foot', 'wezterm'
+    ):
+        if _which(name):
+            return name
+    return None
+
+
+class _InfoFetch:
+    """A running -Si process: its output so far and the row it answers."""
+    __slots__ = ('proc', 'buf', 'name', 'key', 'idx')
+
+    def __init__(self, proc, name, key, idx):
+        self.proc = proc
+        self.buf = bytearray()
+        self.name = name
+        self.key = key
+        self.idx = idx
+
+
+class _Gate:
+    """Calls `cb` once, when every expected tag has reported done."""
+    __slots__ = ('remain', 'cb')
+
+    def __init__(self, tags, cb):
+        self.remain = set(tags)
+        self.cb = cb
+
+    def done(self, tag=None):
+        # tag=None releases every tag at once (e.g. a search stopped at its cap)
+        if self.cb is None:
+            return
+        if tag is None:
+            self.remain.clear()
+        else:
+            self.remain.discard(tag)
+        if not self.remain:
+            cb, self.cb = self.cb, None
+            cb()
+
+
+class TerminalLauncher:
+    def __init__(self):
+        # Resolved once; the action handlers check this on every click
+        self.konsole_path = _which('konsole')
+        self.has_konsole = self.konsole_path is not None
+        self.detected = _detect_terminal()
+        # Launch environment without askpass helpers, built once (None when
+        # there is nothing to strip and the GUI's own env can be inherited)
+        self._base_env = _terminal_env()
+
     def build(self, cmd_str: str):
         term = self.detected
         if not term:
@@ -182,36 +485,100 @@ class TerminalLauncher:
         args = self.build(cmd_str)
         if not args:
             raise RuntimeError('No terminal emulator found. Install alacritty/kitty/xterm, or set $TERMINAL.')
-        env = os.environ.copy()
-        env.pop('SUDO_ASKPASS', None)
-        env.pop('SSH_ASKPASS', None)
+        env = self._base_env
         if os.path.basename(args[0]).lower() == 'alacritty':
+            # Copy so the per-launch additions don't leak into the shared base
+            env = dict(os.environ if env is None else env)
             env['ALACRITTY_CONFIG_FILE'] = '/dev/null'
             env.setdefault('ALACRITTY_LOG', '/tmp/alacritty-yaygui.log')
-        subprocess.Popen(args, env=env)
+        _start_detached(args, env)
 
     def run_konsole_direct(self, program_args, keep_open=False):
         """Run a program in Konsole.
 
-        If keep_open is True, wrap the command in a login shell that pauses after
-        completion so the window does not close immediately.
+        The argv is passed straight to konsole -e (no intermediate shell). If
+        keep_open is True, Konsole's --hold keeps the window open after the
+        program exits so its output can be read.
         """
-        if not shutil.which('konsole'):
+        if not self.has_konsole:
             raise RuntimeError('Konsole is not installed.')
+        # Absolute path from the cached lookup; no $PATH search at launch
         if keep_open:
-            quoted = ' '.join(shlex.quote(a) for a in program_args)
-            # Run via bash -lc so PATH/env are correct and pause afterwards
-            cmd = ['konsole', '-e', 'bash', '-lc', f"{quoted}; echo; read -r"]
+            cmd = [self.konsole_path, '--hold', '-e', *program_args]
         else:
-            cmd = ['konsole', '-e', *program_args]
-        env = os.environ.copy()
+            cmd = [self.konsole_path, '-e', *program_args]
         # Avoid askpass interferance; let yay/sudo handle prompts in the TTY
-        env.pop('SUDO_ASKPASS', None)
-        env.pop('SSH_ASKPASS', None)
-        subprocess.Popen(cmd, env=env)
+        _start_detached(cmd, self._base_env)
 
 
 class YayGUI(QWidget):
+    # Built-in theme stylesheets by lowercased theme name; plain constants so
+    # switching themes is a dict lookup, not a rebuilt string
+    _THEME_QSS = {
+        # Subtle light theme close to system defaults
+        'light': """
+        QWidget { background: #fafafa; color: #202020; }
+        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #ffffff; color: #202020; border: 1px solid #cfcfcf; }
+        QPushButton { background: #f3f3f3; border: 1px solid #cfcfcf; padding: 4px 8px; }
+        QPushButton:hover { background: #e9e9e9; }
+        QTreeWidget, QHeaderView::section { background: #ffffff; color: #202020; }
+        QStatusBar { background: #f0f0f0; }
+        QTabWidget::pane { border: 1px solid #cfcfcf; }
+        QSplitter::handle { background: #e0e0e0; }
+        """,
+        # Conservative dark theme for readability
+        'dark': """
+        QWidget { background: #121212; color: #e0e0e0; }
+        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #1e1e1e; color: #e0e0e0; border: 1px solid #2a2a2a; }
+        QPushButton { background: #1f2933; border: 1px solid #2a2f36; padding: 4px 8px; color: #e0e0e0; }
+        QPushButton:hover { background: #26323d; }
+        QTreeWidget, QHeaderView::section { background: #1a1a1a; color: #e0e0e0; }
+        QStatusBar { background: #181818; }
+        QTabWidget::pane { border: 1px solid #2a2a2a; }
+        QSplitter::handle { background: #2a2a2a; }
+        """,
+        'nord': """
+        QWidget { background: #2e3440; color: #d8dee9; }
+        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #3b4252; color: #eceff4; border: 1px solid #434c5e; }
+        QPushButton { background: #434c5e; border: 1px solid #4c566a; padding: 4px 8px; color: #eceff4; }
+        QPushButton:hover { background: #4c566a; }
+        QTreeWidget, QHeaderView::section { background: #3b4252; color: #eceff4; }
+        QStatusBar { background: #2e3440; }
+        QTabWidget::pane { border: 1px solid #434c5e; }
+        QSplitter::handle { background: #434c5e; }
+        """,
+        'dracula': """
+        QWidget { background: #282a36; color: #f8f8f2; }
+        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #1e1f29; color: #f8f8f2; border: 1px solid #44475a; }
+        QPushButton { background: #44475a; border: 1px solid #5a5f73; padding: 4px 8px; color: #f8f8f2; }
+        QPushButton:hover { background: #5a5f73; }
+        QTreeWidget, QHeaderView::section { background: #1e1f29; color: #f8f8f2; }
+        QStatusBar { background: #1e1f29; }
+        QTabWidget::pane { border: 1px solid #44475a; }
+        QSplitter::handle { background: #44475a; }
+        """,
+        'solarized light': """
+        QWidget { background: #fdf6e3; color: #657b83; }
+        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #eee8d5; color: #586e75; border: 1px solid #d6ceb6; }
+        QPushButton { background: #e9e2c6; border: 1px solid #d6ceb6; padding: 4px 8px; color: #586e75; }
+        QPushButton:hover { background: #e2dabd; }
+        QTreeWidget, QHeaderView::section { background: #fefcf2; color: #586e75; }
+        QStatusBar { background: #f3eddb; }
+        QTabWidget::pane { border: 1px solid #d6ceb6; }
+        QSplitter::handle { background: #e2dabd; }
+        """,
+        'solarized dark': """
+        QWidget { background: #002b36; color: #93a1a1; }
+        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #073642; color: #93a1a1; border: 1px solid #0f3945; }
+        QPushButton { background: #0f3945; border: 1px solid #12404d; padding: 4px 8px; color: #93a1a1; }
+        QPushButton:hover { background: #12404d; }
+        QTreeWidget, QHeaderView::section { background: #073642; color: #93a1a1; }
+        QStatusBar { background: #002b36; }
+        QTabWidget::pane { border: 1px solid #0f3945; }
+        QSplitter::handle { background: #0f3945; }
+        """,
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle('Yay GUI - Rebuilt')
@@ -219,58 +586,84 @@ class YayGUI(QWidget):
 
         self.term = TerminalLauncher()
 
-        self.search_proc = None
-        self.installed_proc = None
-        self.search_buffer = ''
-        self.installed_buffer = ''
-        self.upd_proc = None
-        self.upd_stage = None  # 'repo' or 'aur'
-        self.upd_repo_buf = ''
-        self.upd_aur_buf = ''
+        # Repo (pacman -Qu) and AUR (yay -Qua) update checks run side by side
+        self._active_upd_procs = []
         # Streaming helpers
-        self._search_stream_pending = ''
+        # Header resize modes parked while a view is bulk-loading, by view
+        self._saved_resize_modes = {}
+        # Checked rows kept up to date from itemChanged, so actions never
+        # rescan the trees: search 'repo/name' key -> name (a name can be
+        # listed by both a repo and the AUR), installed name -> source label
+        self._checked_search = {}
+        self._checked_installed = {}
+        # Search rows as (item, source label), tagged once at insert so the
+        # source filter never reads text back from the items
+        self._search_rows = []
         self._search_stream_current = None
         self._search_stream_item = None
-        self._search_header_re = re.compile(r'^(?P<repo>[^/\s]+)/(?P<name>\S+)\s+(?P<ver>.+)$')
-        self._upd_line_re = re.compile(r'^(?P<name>\S+)\s+(?P<old>\S+)\s+->\s+(?P<new>\S+)\s*$')
-        self._repo_pending = ''
-        self._aur_pending = ''
-        self._repo_done = False
-        self._aur_done = False
         self._repo_count = 0
         self._aur_count = 0
         # Installed streaming
-        self._installed_pending = ''
         self._installed_count = 0
         self._installed_max_items = 5000
         self._active_inst_procs = []
-        self._inst_pending = {}
-        self._inst_source_by_proc = {}
+        # Streaming progress messages are throttled: chunks only arm these
+        # timers, so the status bar repaints at most every 100 ms
+        self._installed_status_timer = QTimer(self)
+        self._installed_status_timer.setSingleShot(True)
+        self._installed_status_timer.setInterval(100)
+        self._installed_status_timer.timeout.connect(self._show_installed_progress)
+        self._updates_status_timer = QTimer(self)
+        self._updates_status_timer.setSingleShot(True)
+        self._updates_status_timer.setInterval(100)
+        self._updates_status_timer.timeout.connect(self._show_updates_progress)
         # Optional cap to keep UI snappy on huge searches
         self._search_max_items = 500
         # Parallel search state
         self._active_search_procs = []
-        self._search_pending = {'repo': '', 'aur': ''}
-        self._search_ctx = {
-            'repo': {'current': None, 'item': None},
-            'aur': {'current': None, 'item': None}
-        }
-        self._search_done = {'repo': True, 'aur': True}
+        # Completion gates for the paired processes of each tab
+        self._search_gate = _Gate((), self._search_all_finished)
+        self._installed_gate = _Gate((), self._installed_all_finished)
+        self._updates_gate = _Gate((), self._updates_all_finished)
         # Search pagination/state
         self._search_default_max_items = getattr(self, '_search_max_items', 500)
         self._search_page = 1
         self._search_truncated = False
-        self._preserve_checked_names = None
+        self._preserve_checked_keys = None
         # Details fetch state
-        self._info_procs = {}
-        self._info_buffers = {}
+        self.pkgs = PackageTable()  # rows of the search results view
+        self._info_procs = {}  # repo/name key -> QProcess
+        self._info_fetches = {}  # QProcess -> _InfoFetch
+        # (key, row index) waiting for the debounce below, or None. Arrow-key
+        # browsing restarts the timer and replaces the previous row, so only
+        # the row the user stops on spawns a process.
+        self._info_pending = None
+        self._info_flush_timer = QTimer(self)
+        self._info_flush_timer.setSingleShot(True)
+        self._info_flush_timer.setInterval(120)
+        self._info_flush_timer.timeout.connect(self._flush_info_requests)
+        # Parsed -Si results by repo/name, least recently used first. Kept
+        # on disk between runs; entries carry the version they were fetched
+        # for so an upgraded package is looked up again.
+        self._info_cache = load_si_cache()
+        self._info_cache_max = 4096
+        self._info_cache_dirty = False
+        self._info_cache_save_timer = QTimer(self)
+        self._info_cache_save_timer.setSingleShot(True)
+        self._info_cache_save_timer.setInterval(5000)
+        self._info_cache_save_timer.timeout.connect(self._save_info_cache)
         self._current_info_key = None
         # Installed names cache for hiding already-installed from search
         self._installed_names = set()
         self._installed_names_ready = False
-        self._installed_names_buf = ''
+        self._installed_names_new = set()  # filled while -Qq streams in
         self._installed_names_proc = None
         self._pending_search_term = None
+        # yay health probe result (None = not known yet) and its background process
+        self._yay_usable = None
+        self._yay_probe_proc = None
+        self._yay_probed_at = float('-inf')  # time.monotonic() of the last result
+        self._yay_probe_ttl = 30.0
 
         # ----- Root layout with top-right Settings gear and tabs -----
         root = QVBoxLayout(self)
@@ -323,8 +716,18 @@ class YayGUI(QWidget):
         # ---- Settings ----
         self.keep_konsole_open = True
 
+        # (item, 'name version' lowercased, source label) per installed row,
+        # kept alongside the view so filtering never re-reads item text
+        self._installed_rows = []
+
         # ---- Updates deduplication set ----
-        self._updates_seen = set()  # (source, name)
+        self._updates_seen = set()  # package names already listed (any source)
+        # (item, "name current new" lowercased, source label) per update row,
+        # joined once at insert so filtering never re-reads items
+        self._update_rows = []
+        # Last applied update-filter query and the row indices whose text matched it
+        self._update_filter_q = None
+        self._update_filter_hits = []
 
         # Apply modern icons and accents to buttons
         try:
@@ -348,6 +751,11 @@ class YayGUI(QWidget):
             self._refresh_installed_names()
         except Exception:
             pass
+        # Probe yay in the background so Install/Update clicks do not block on it
+        try:
+            self._probe_yay_async()
+        except Exception:
+            pass
 
     # ---- Graceful shutdown ----
     def closeEvent(self, event):
@@ -371,13 +779,6 @@ class YayGUI(QWidget):
                 except Exception:
                     pass
             self._active_inst_procs = []
-            if getattr(self, 'installed_proc', None):
-                try:
-                    if self.installed_proc.state() != QProcess.NotRunning:
-                        self.installed_proc.kill(); self.installed_proc.waitForFinished(500)
-                except Exception:
-                    pass
-                self.installed_proc = None
         except Exception:
             pass
         try:
@@ -391,6 +792,7 @@ class YayGUI(QWidget):
         except Exception:
             pass
         try:
+            self._info_flush_timer.stop()
             for k, proc in list(getattr(self, '_info_procs', {}).items()):
                 try:
                     if proc.state() != QProcess.NotRunning:
@@ -400,6 +802,11 @@ class YayGUI(QWidget):
             self._info_procs = {}
         except Exception:
             pass
+        try:
+            self._info_cache_save_timer.stop()
+            self._save_info_cache()
+        except Exception:
+            pass
         try:
             if getattr(self, '_installed_names_proc', None):
                 if self._installed_names_proc.state() != QProcess.NotRunning:
@@ -407,6 +814,13 @@ class YayGUI(QWidget):
             self._installed_names_proc = None
         except Exception:
             pass
+        try:
+            if getattr(self, '_yay_probe_proc', None):
+                if self._yay_probe_proc.state() != QProcess.NotRunning:
+                    self._yay_probe_proc.kill(); self._yay_probe_proc.waitForFinished(300)
+            self._yay_probe_proc = None
+        except Exception:
+            pass
         # Proceed with normal close
         super().closeEvent(event)
 
@@ -438,22 +852,53 @@ class YayGUI(QWidget):
             self.installed_status.showMessage(f'Error: {e}')
         except Exception:
             pass
+        # A process that never started emits no finished(); release its
+        # gate slot here so the listing still finalizes
+        if e == QProcess.FailedToStart:
+            try:
+                self._installed_gate.done(self.sender().property('which'))
+            except Exception:
+                pass
 
     def _on_repo_updates_error(self, e):
         try:
             self.update_status.showMessage(f'Repo update error: {e}')
         except Exception:
             pass
+        if e == QProcess.FailedToStart:
+            try:
+                self._updates_one_finished('repo')
+            except Exception:
+                pass
 
     def _on_aur_updates_error(self, e):
         try:
             self.update_status.showMessage(f'AUR update error: {e}')
         except Exception:
             pass
+        # e.g. yay not installed: no finished() follows
+        if e == QProcess.FailedToStart:
+            try:
+                self._updates_one_finished('aur')
+            except Exception:
+                pass
 
     def _on_info_error(self, e):
+        # Other errors are followed by finished(), which handles them. A
+        # process that never started emits no finished(): report it and
+        # release its requests here or their keys would block every retry
+        if e != QProcess.FailedToStart:
+            return
+        proc = self.sender()
         try:
-            self.status_bar.showMessage(f'Info fetch error: {e}')
+            self.status_bar.showMessage(f'Could not fetch package details: {proc.errorString()}')
+        except Exception:
+            pass
+        try:
+            fetch = self._drop_info_proc(proc)
+            if fetch is not None and fetch.key == self._current_info_key \
+                    and self.pkgs.keys[fetch.idx:fetch.idx + 1] == [fetch.key]:
+                self._render_sidebar(fetch.idx, 'No description available.')
         except Exception:
             pass
 
@@ -477,20 +922,72 @@ class YayGUI(QWidget):
 
     # ---- Helpers: tool availability ----
     def _is_yay_usable(self) -> bool:
+        # Normally answered by the background probe started in __init__; only
+        # probe synchronously if that has not finished (or could not start)
+        if self._yay_usable is not None:
+            # Answer from the cached result right away; once it is older than
+            # the TTL, re-probe in the background for the next action (yay may
+            # have been rebuilt or broken by an upgrade in the meantime)
+            if time.monotonic() - self._yay_probed_at > self._yay_probe_ttl:
+                proc = self._yay_probe_proc
+                if proc is None or proc.state() == QProcess.NotRunning:
+                    self._probe_yay_async()
+            return self._yay_usable
+        # Not through the cached _which: yay may be installed or removed
+        # while the app runs. Failures are cached too, so the next actions
+        # answer from the cache instead of probing again until the TTL.
+        usable = False
         path = shutil.which('yay')
-        if not path:
-            return False
-        try:
-            cp = subprocess.run(['bash', '-lc', 'yay --version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=3)
-        except Exception:
-            return False
-        out = (cp.stdout or b'') + (cp.stderr or b'')
-        text = out.decode('utf-8', errors='ignore').lower()
+        if path:
+            try:
+                # Exec yay directly: no shell and no login profile to source
+                cp = subprocess.run([path, '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=3)
+            except Exception:
+                pass
+            else:
+                usable = self._yay_version_output_ok((cp.stdout or b'') + (cp.stderr or b''))
+        self._yay_usable = usable
+        self._yay_probed_at = time.monotonic()
+        return usable
+
+    @staticmethod
+    def _yay_version_output_ok(out: bytes) -> bool:
+        text = out.decode('utf-8', errors='replace').lower()
         if 'error while loading shared libraries' in text:
             return False
         # non-zero could be fine, but if version printed it's good enough
         return True
 
+    def _probe_yay_async(self):
+        # shutil.which, not the cached _which, so re-probes see yay appear
+        # or disappear
+        path = shutil.which('yay')
+        if not path:
+            self._yay_usable = False
+            self._yay_probed_at = time.monotonic()
+            return
+        proc = QProcess(self)
+        proc.setProgram(path)
+        proc.setArguments(['--version'])
+        proc.setProcessChannelMode(QProcess.MergedChannels)
+        proc.finished.connect(self._yay_probe_finished)
+        self._yay_probe_proc = proc
+        proc.start()
+
+    def _yay_probe_finished(self, *_):
+        proc = self._yay_probe_proc
+        self._yay_probe_proc = None
+        if proc is None:
+            return
+        # Re-probes create a new process each time; free the finished one
+        proc.deleteLater()
+        try:
+            out = bytes(proc.readAllStandardOutput())
+        except Exception:
+            return
+        self._yay_usable = self._yay_version_output_ok(out)
+        self._yay_probed_at = time.monotonic()
+
     # ---- UI builders ----
     def _build_search_tab(self):
         tab = QWidget()
@@ -578,10 +1075,13 @@ class YayGUI(QWidget):
             self.sidebar_text.setObjectName('sidebarText')
         except Exception:
             pass
-        self.sidebar_text.setHtml('<h3>Details</h3><p>Click a package to view details.</p>')
+        self._sidebar_html = None
+        self._set_sidebar_html('<h3>Details</h3><p>Click a package to view details.</p>')
         layout.addWidget(self.sidebar_text, 1)
 
         self.search_results.itemClicked.connect(self._show_pkg_info)
+        self.search_results.currentItemChanged.connect(self._on_search_current_changed)
+        self.search_results.itemChanged.connect(self._on_search_item_changed)
         return tab
 
     # ---- Installed names cache (for hiding from search) ----
@@ -592,12 +1092,22 @@ class YayGUI(QWidget):
                 self._installed_names_proc.kill(); self._installed_names_proc.waitForFinished(500)
         except Exception:
             pass
-        self._installed_names_buf = ''
+        self._installed_names_new = set()
         self._installed_names_ready = False
+        # A directory listing of the local DB gives the same names as -Qq
+        # without starting a process; fall back to pacman if it is unreadable
+        names = read_local_db_names()
+        if names:
+            self._installed_names_new = names
+            self._installed_names_finished()
+            return
         proc = QProcess(self)
         proc.setProgram('pacman')
         proc.setArguments(['--color', 'never', '-Qq'])
-        proc.setProcessChannelMode(QProcess.MergedChannels)
+        proc.setProcessEnvironment(_query_env())
+        # Warnings on stderr would otherwise be read as package names
+        proc.setProcessChannelMode(QProcess.SeparateChannels)
+        proc.setStandardErrorFile(QProcess.nullDevice())
         proc.readyReadStandardOutput.connect(self._collect_installed_names_output)
         proc.finished.connect(self._installed_names_finished)
         # not critical to show errors
@@ -607,24 +1117,24 @@ class YayGUI(QWidget):
     def _collect_installed_names_output(self):
         if not self._installed_names_proc:
             return
-        try:
-            chunk = bytes(self._installed_names_proc.readAllStandardOutput()).decode('utf-8', errors='ignore')
-        except Exception:
-            chunk = ''
-        if chunk:
-            self._installed_names_buf += chunk
+        # Parse complete lines as they arrive; Qt holds the partial tail
+        self._add_installed_names(read_complete_lines(self._installed_names_proc))
+
+    def _add_installed_names(self, lines):
+        # A read that ended mid-line yields nothing yet; skip the join/split
+        if not lines:
+            return
+        # -Qq prints one bare name per line and stderr is not captured, so
+        # every whitespace-separated token is a name: one C-level split
+        # instead of a Python loop over the lines
+        self._installed_names_new.update('\n'.join(lines).split())
 
     def _installed_names_finished(self):
-        text = self._installed_names_buf
-        names = set()
-        for raw in (text or '').split('\n'):
-            line = clean_control_codes(raw).strip()
-            if not line:
-                continue
-            # take first token as name
-            name = line.split()[0]
-            names.add(name)
-        self._installed_names = names
+        # Flush the last line (pacman may not end output with a newline)
+        if self._installed_names_proc:
+            self._add_installed_names(read_complete_lines(self._installed_names_proc, final=True))
+        self._installed_names = self._installed_names_new
+        self._installed_names_new = set()
         self._installed_names_ready = True
         self._installed_names_proc = None
         # If a search was pending, run it now
@@ -651,7 +1161,12 @@ class YayGUI(QWidget):
             pass
         self.installed_filter = QLineEdit()
         self.installed_filter.setPlaceholderText('Filter installed (name/version)')
-        self.installed_filter.textChanged.connect(self._filter_installed_list)
+        # Coalesce keystrokes: filter once typing pauses instead of per character
+        self._installed_filter_timer = QTimer(self)
+        self._installed_filter_timer.setSingleShot(True)
+        self._installed_filter_timer.setInterval(150)
+        self._installed_filter_timer.timeout.connect(self._filter_installed_list)
+        self.installed_filter.textChanged.connect(self._queue_installed_filter)
         try:
             self.installed_filter.setClearButtonEnabled(True)
         except Exception:
@@ -710,6 +1225,7 @@ class YayGUI(QWidget):
         header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(3, QHeaderView.Stretch)
+        self.installed_view.itemChanged.connect(self._on_installed_item_changed)
         v.addWidget(self.installed_view)
         return tab
 
@@ -732,11 +1248,15 @@ class YayGUI(QWidget):
 
         # Controls row (filter + select all + actions, Source aligned far right)
         controls = QHBoxLayout()
-        from PyQt5.QtWidgets import QLineEdit
         # Filter field first (stretch)
         self.update_filter = QLineEdit()
         self.update_filter.setPlaceholderText('Filter updates...')
-        self.update_filter.textChanged.connect(self._filter_updates_list)
+        # Coalesce keystrokes: filter once typing pauses instead of per character
+        self._update_filter_timer = QTimer(self)
+        self._update_filter_timer.setSingleShot(True)
+        self._update_filter_timer.setInterval(120)
+        self._update_filter_timer.timeout.connect(self._filter_updates_list)
+        self.update_filter.textChanged.connect(self._queue_updates_filter)
         try:
             self.update_filter.setClearButtonEnabled(True)
         except Exception:
@@ -1033,26 +1553,21 @@ class YayGUI(QWidget):
             return
         css = ''
         n = (name or '').lower()
-        if n == 'dark':
-            css = self._dark_theme_stylesheet()
-        elif n == 'light':
-            css = self._light_theme_stylesheet()
-        elif n == 'nord':
-            css = self._nord_theme_stylesheet()
-        elif n == 'dracula':
-            css = self._dracula_theme_stylesheet()
-        elif n == 'solarized dark':
-            css = self._solarized_dark_theme_stylesheet()
-        elif n == 'solarized light':
-            css = self._solarized_light_theme_stylesheet()
-        elif n == 'custom':
+        if n == 'custom':
             css = getattr(self, '_custom_css', '')
+        else:
+            # 'system' and unknown names have no entry: empty stylesheet
+            css = self._THEME_QSS.get(n, '')
         # Always append modern button styling
         try:
             css = (css or '') + self._modern_button_styles()
         except Exception:
             pass
         # System -> empty stylesheet plus our modern button rules
+        # Re-applying an identical stylesheet still re-polishes every widget
+        if css == getattr(self, '_applied_qss', None):
+            return
+        self._applied_qss = css
         app.setStyleSheet(css)
 
     def _apply_settings_from_ui(self):
@@ -1088,6 +1603,26 @@ class YayGUI(QWidget):
         self._save_settings()
 
     # ---- Visual helpers ----
+    def _suspend_column_sizing(self, view):
+        # ResizeToContents re-measures every row on each insert; freeze those
+        # columns as Interactive while rows stream in
+        if view in self._saved_resize_modes:
+            return
+        header = view.header()
+        modes = [header.sectionResizeMode(c) for c in range(header.count())]
+        self._saved_resize_modes[view] = modes
+        for c, mode in enumerate(modes):
+            if mode == QHeaderView.ResizeToContents:
+                header.setSectionResizeMode(c, QHeaderView.Interactive)
+
+    def _restore_column_sizing(self, view):
+        # Put the original modes back; columns are measured once here
+        modes = self._saved_resize_modes.pop(view, None)
+        if not modes:
+            return
+        header = view.header()
+        for c, mode in enumerate(modes):
+            header.setSectionResizeMode(c, mode)
 
     # ---- Behavior toggles ----
     # Removed: modern colors toggle
@@ -1096,8 +1631,7 @@ class YayGUI(QWidget):
 
     def _on_accent_edited(self, text: str):
         s = (text or '').strip()
-        import re as _re
-        if _re.match(r'^#[0-9a-fA-F]{6}$', s):
+        if _ACCENT_RE.match(s):
             self._accent_color = s
             self._apply_theme(getattr(self.theme_combo, 'currentText', lambda: 'System')())
             self._save_settings()
@@ -1132,7 +1666,6 @@ class YayGUI(QWidget):
 
     def _set_btn_icon(self, btn: QPushButton, icon_names):
         try:
-            from PyQt5.QtGui import QIcon
             for name in icon_names:
                 ic = QIcon.fromTheme(name)
                 if ic and not ic.isNull():
@@ -1255,32 +1788,6 @@ class YayGUI(QWidget):
         QStatusBar { border: 1px solid rgba(0,0,0,0.12); border-radius: 6px; padding: 2px 6px; font-size: {font_px}px; }
         """
 
-    def _light_theme_stylesheet(self) -> str:
-        # Subtle light theme close to system defaults
-        return """
-        QWidget { background: #fafafa; color: #202020; }
-        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #ffffff; color: #202020; border: 1px solid #cfcfcf; }
-        QPushButton { background: #f3f3f3; border: 1px solid #cfcfcf; padding: 4px 8px; }
-        QPushButton:hover { background: #e9e9e9; }
-        QTreeWidget, QHeaderView::section { background: #ffffff; color: #202020; }
-        QStatusBar { background: #f0f0f0; }
-        QTabWidget::pane { border: 1px solid #cfcfcf; }
-        QSplitter::handle { background: #e0e0e0; }
-        """
-
-    def _dark_theme_stylesheet(self) -> str:
-        # Conservative dark theme for readability
-        return """
-        QWidget { background: #121212; color: #e0e0e0; }
-        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #1e1e1e; color: #e0e0e0; border: 1px solid #2a2a2a; }
-        QPushButton { background: #1f2933; border: 1px solid #2a2f36; padding: 4px 8px; color: #e0e0e0; }
-        QPushButton:hover { background: #26323d; }
-        QTreeWidget, QHeaderView::section { background: #1a1a1a; color: #e0e0e0; }
-        QStatusBar { background: #181818; }
-        QTabWidget::pane { border: 1px solid #2a2a2a; }
-        QSplitter::handle { background: #2a2a2a; }
-        """
-
     def _on_search_cap_changed(self, value: int):
         try:
             self._search_default_max_items = int(value)
@@ -1361,54 +1868,6 @@ class YayGUI(QWidget):
         except Exception:
             pass
 
-    def _nord_theme_stylesheet(self) -> str:
-        return """
-        QWidget { background: #2e3440; color: #d8dee9; }
-        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #3b4252; color: #eceff4; border: 1px solid #434c5e; }
-        QPushButton { background: #434c5e; border: 1px solid #4c566a; padding: 4px 8px; color: #eceff4; }
-        QPushButton:hover { background: #4c566a; }
-        QTreeWidget, QHeaderView::section { background: #3b4252; color: #eceff4; }
-        QStatusBar { background: #2e3440; }
-        QTabWidget::pane { border: 1px solid #434c5e; }
-        QSplitter::handle { background: #434c5e; }
-        """
-
-    def _dracula_theme_stylesheet(self) -> str:
-        return """
-        QWidget { background: #282a36; color: #f8f8f2; }
-        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #1e1f29; color: #f8f8f2; border: 1px solid #44475a; }
-        QPushButton { background: #44475a; border: 1px solid #5a5f73; padding: 4px 8px; color: #f8f8f2; }
-        QPushButton:hover { background: #5a5f73; }
-        QTreeWidget, QHeaderView::section { background: #1e1f29; color: #f8f8f2; }
-        QStatusBar { background: #1e1f29; }
-        QTabWidget::pane { border: 1px solid #44475a; }
-        QSplitter::handle { background: #44475a; }
-        """
-
-    def _solarized_light_theme_stylesheet(self) -> str:
-        return """
-        QWidget { background: #fdf6e3; color: #657b83; }
-        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #eee8d5; color: #586e75; border: 1px solid #d6ceb6; }
-        QPushButton { background: #e9e2c6; border: 1px solid #d6ceb6; padding: 4px 8px; color: #586e75; }
-        QPushButton:hover { background: #e2dabd; }
-        QTreeWidget, QHeaderView::section { background: #fefcf2; color: #586e75; }
-        QStatusBar { background: #f3eddb; }
-        QTabWidget::pane { border: 1px solid #d6ceb6; }
-        QSplitter::handle { background: #e2dabd; }
-        """
-
-    def _solarized_dark_theme_stylesheet(self) -> str:
-        return """
-        QWidget { background: #002b36; color: #93a1a1; }
-        QLineEdit, QPlainTextEdit, QTextEdit, QComboBox { background: #073642; color: #93a1a1; border: 1px solid #0f3945; }
-        QPushButton { background: #0f3945; border: 1px solid #12404d; padding: 4px 8px; color: #93a1a1; }
-        QPushButton:hover { background: #12404d; }
-        QTreeWidget, QHeaderView::section { background: #073642; color: #93a1a1; }
-        QStatusBar { background: #002b36; }
-        QTabWidget::pane { border: 1px solid #0f3945; }
-        QSplitter::handle { background: #0f3945; }
-        """
-
     def _import_qss(self):
         path, _ = QFileDialog.getOpenFileName(self, 'Import QSS', '', 'Qt Stylesheets (*.qss);;All Files (*)')
         if not path:
@@ -1428,24 +1887,10 @@ class YayGUI(QWidget):
         # Determine current css
         current = self.theme_combo.currentText() if hasattr(self, 'theme_combo') else 'System'
         n = (current or '').lower()
-        if n == 'system':
-            css = ''
-        elif n == 'light':
-            css = self._light_theme_stylesheet()
-        elif n == 'dark':
-            css = self._dark_theme_stylesheet()
-        elif n == 'nord':
-            css = self._nord_theme_stylesheet()
-        elif n == 'dracula':
-            css = self._dracula_theme_stylesheet()
-        elif n == 'solarized dark':
-            css = self._solarized_dark_theme_stylesheet()
-        elif n == 'solarized light':
-            css = self._solarized_light_theme_stylesheet()
-        elif n == 'custom':
+        if n == 'custom':
             css = getattr(self, '_custom_css', '')
         else:
-            css = ''
+            css = self._THEME_QSS.get(n, '')
         path, _ = QFileDialog.getSaveFileName(self, 'Export QSS', 'theme.qss', 'Qt Stylesheets (*.qss);;All Files (*)')
         if not path:
             return
@@ -1487,7 +1932,10 @@ class YayGUI(QWidget):
                 pass
         self._active_search_procs = []
         self.search_results.clear()
-        self.sidebar_text.setHtml('<h3>Details</h3><p>Searching...</p>')
+        self.pkgs.clear()
+        self._search_rows = []
+        self._checked_search = {}
+        self._set_sidebar_html('<h3>Details</h3><p>Searching...</p>')
         sel = self.search_source_filter.currentText() if hasattr(self, 'search_source_filter') else 'All'
         if sel == 'Pacman':
             self.status_bar.showMessage('Searching repos...')
@@ -1495,17 +1943,15 @@ class YayGUI(QWidget):
             self.status_bar.showMessage('Searching AUR...')
         else:
             self.status_bar.showMessage('Searching repos + AUR...')
-        self.search_buffer = ''
-        self._search_pending = {'repo': '', 'aur': ''}
-        self._search_ctx = {
-            'repo': {'current': None, 'item': None},
-            'aur': {'current': None, 'item': None}
-        }
-        # Mark sources we are not running as already done so completion logic works
+        # The gate only waits for the sources we actually run
         run_repo = (sel in ('All', 'Pacman'))
         run_aur = (sel in ('All', 'Yay'))
-        self._search_done = {'repo': not run_repo, 'aur': not run_aur}
+        self._search_gate = _Gate(
+            [src for src, run in (('repo', run_repo), ('aur', run_aur)) if run],
+            self._search_all_finished,
+        )
         self.search_results.setSortingEnabled(False)
+        self._suspend_column_sizing(self.search_results)
         # Disable repaint while adding many rows to speed things up
         try:
             self.search_results.setUpdatesEnabled(False)
@@ -1518,8 +1964,8 @@ class YayGUI(QWidget):
             self._search_max_items = max(1, int(self._search_default_max_items) * max(1, int(getattr(self, '_search_page', 1))))
         except Exception:
             self._search_max_items = self._search_default_max_items
-        # Preserve previously checked names if provided
-        self._preserve_checked_names = set(preserve_checked or [])
+        # Preserve previously checked rows ('repo/name' keys) if provided
+        self._preserve_checked_keys = set(preserve_checked or [])
         # Hide See more until we know we're truncated
         try:
             self.see_more_button.setVisible(False)
@@ -1531,9 +1977,11 @@ class YayGUI(QWidget):
             repo = QProcess(self)
             repo.setProgram('pacman')
             repo.setArguments(['--color', 'never', '-Ss', term])
+            repo.setProcessEnvironment(_query_env())
             repo.setProcessChannelMode(QProcess.MergedChannels)
-            repo.readyReadStandardOutput.connect(lambda: self._collect_search_output_streaming('repo', repo))
-            repo.finished.connect(lambda _c=0, _s=0: self._search_one_finished('repo'))
+            repo.setProperty('source', 'repo')
+            repo.readyReadStandardOutput.connect(self._on_search_ready)
+            repo.finished.connect(self._on_search_finished)
             repo.errorOccurred.connect(self._on_repo_search_error)
             self._active_search_procs.append(repo)
             repo.start()
@@ -1543,113 +1991,117 @@ class YayGUI(QWidget):
             aur = QProcess(self)
             aur.setProgram('yay')
             aur.setArguments(['--color=never', '-Ss', term, '--aur'])
+            aur.setProcessEnvironment(_query_env())
             aur.setProcessChannelMode(QProcess.MergedChannels)
-            aur.readyReadStandardOutput.connect(lambda: self._collect_search_output_streaming('aur', aur))
-            aur.finished.connect(lambda _c=0, _s=0: self._search_one_finished('aur'))
+            aur.setProperty('source', 'aur')
+            aur.readyReadStandardOutput.connect(self._on_search_ready)
+            aur.finished.connect(self._on_search_finished)
             aur.errorOccurred.connect(self._on_aur_search_error)
             self._active_search_procs.append(aur)
             aur.start()
 
-    def _collect_search_output(self):
-        # Kept for completeness; not used now
-        self.search_buffer += bytes(self.search_proc.readAllStandardOutput()).decode('utf-8', errors='ignore')
+    # Shared slots for both search processes; the source rides on the process
+    def _on_search_ready(self):
+        proc = self.sender()
+        self._collect_search_output_streaming(proc.property('source'), proc)
+
+    def _on_search_finished(self, *_):
+        self._search_one_finished(self.sender().property('source'))
 
     def _collect_search_output_streaming(self, source, proc):
-        chunk = bytes(proc.readAllStandardOutput()).decode('utf-8', errors='ignore')
-        if not chunk:
+        # Once capped, late reads are dropped without parsing
+        if self._search_truncated:
             return
-        # If we've reached the cap, stop this source early to keep things snappy
-        try:
-            if self.search_results.topLevelItemCount() >= self._search_max_items:
-                if proc.state() != QProcess.NotRunning:
-                    proc.kill(); proc.waitForFinished(100)
-                # Mark done for this source; completion handler will flip sorting and repaint
-                if not self._search_done.get(source, True):
-                    self._search_done[source] = True
-                    self._search_truncated = True
-                    try:
-                        if hasattr(self, 'see_more_button'):
-                            self.see_more_button.setVisible(True)
-                    except Exception:
-                        pass
-                    if all(self._search_done.values()):
-                        self._search_one_finished(source)
-                return
-        except Exception:
-            pass
-        self._search_pending[source] += chunk
-        lines = self._search_pending[source].split('\n')
-        self._search_pending[source] = lines.pop()  # keep last partial line
+        if self.search_results.topLevelItemCount() >= self._search_max_items:
+            self._stop_search_at_cap(source)
+            return
+        lines = read_complete_lines(proc)  # Qt keeps the last partial line
+        if not lines:
+            return
+        # New rows are collected here and added with one addTopLevelItems call
+        batch = []
+        # Loop invariants bound once instead of looked up per line
+        room = self._search_max_items - self.search_results.topLevelItemCount()
+        term = self._current_search_term
+        installed = self._installed_names
+        preserve = self._preserve_checked_keys or _EMPTY
+        match = _SEARCH_LINE_RE.match
+        add_pkg = self.pkgs.add
+        keys = self.pkgs.keys
+        add_row = self._search_rows.append
+        capped = False
         for raw in lines:
-            line = clean_control_codes(raw.rstrip('\r'))
-            if not line or line.startswith('::'):
+            # Indented description lines are not needed here: the sidebar
+            # fetches the full description on demand via -Si
+            if not raw or raw[0] == ' ':
+                continue
+            # One match classifies the line: header, banner, or neither
+            m = match(raw.rstrip('\r'))
+            if m is None or m.lastgroup == 'banner':
                 continue
             # Stop adding if we hit cap to keep UI responsive
-            if self.search_results.topLevelItemCount() >= self._search_max_items:
-                # Mark truncated and surface the See more button right away
-                try:
-                    self._search_truncated = True
-                    if hasattr(self, 'see_more_button'):
-                        self.see_more_button.setVisible(True)
-                except Exception:
-                    pass
-                # Stop this source immediately
-                try:
-                    if proc.state() != QProcess.NotRunning:
-                        proc.kill(); proc.waitForFinished(100)
-                    if not self._search_done.get(source, True):
-                        self._search_done[source] = True
-                        if all(self._search_done.values()):
-                            self._search_one_finished(source)
-                except Exception:
-                    pass
-                return
-            m = self._search_header_re.match(line)
-            if m:
-                # finalize previous (nothing special needed)
-                # create new item
-                p = {
-                    'repo': m.group('repo'),
-                    'name': m.group('name'),
-                    'version': m.group('ver').strip(),
-                    'description': ''
-                }
-                # Enforce name-only match
-                if self._current_search_term and self._current_search_term not in p['name'].lower():
-                    continue
-                # Skip if installed
-                try:
-                    if p['name'] in getattr(self, '_installed_names', set()):
-                        continue
-                except Exception:
-                    pass
-                it = QTreeWidgetItem(self.search_results)
-                it.setText(0, '')
-                it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
-                it.setCheckState(0, Qt.Unchecked)
-                it.setText(1, p['name'])
-                it.setText(2, p['version'])
-                it.setData(1, Qt.UserRole, p)
-                src = 'Yay' if (p['repo'] or '').lower() == 'aur' else 'Pacman'
-                it.setText(3, src)
-                # Restore checked state if we are expanding results
-                try:
-                    if p['name'] in (getattr(self, '_preserve_checked_names', set()) or set()):
-                        it.setCheckState(0, Qt.Checked)
-                except Exception:
-                    pass
-                # Apply source filter immediately
-                sel = self.search_source_filter.currentText() if hasattr(self, 'search_source_filter') else 'All'
-                if sel in ('Pacman', 'Yay') and src != sel:
-                    it.setHidden(True)
-                self._search_ctx[source]['current'] = p
-                self._search_ctx[source]['item'] = it
+            if len(batch) >= room:
+                capped = True
+                break
+            name = m.group('name')
+            # Skip if installed (one hash lookup, before anything else is built)
+            if name in installed:
                 continue
-            if line.startswith(' ') and self._search_ctx[source]['current'] and self._search_ctx[source]['item']:
-                cur = self._search_ctx[source]['current']
-                it = self._search_ctx[source]['item']
-                cur['description'] += line.strip() + ' '
-                # description now shown in sidebar only
+            # Enforce name-only match
+            if term and term not in name.lower():
+                continue
+            repo = m.group('repo')
+            version = m.group('ver').strip()
+            repo_l = repo.lower()
+            src = 'Yay' if repo_l == 'aur' else 'Pacman'
+            # All column texts in the constructor; default item flags are
+            # already user-checkable
+            it = QTreeWidgetItem(['', name, version, src])
+            idx = add_pkg(repo, name, version)
+            it.setData(1, Qt.UserRole, idx)
+            # Restore checked state if we are expanding results. The item is
+            # not in the view yet, so itemChanged won't record it; do it here.
+            if preserve and keys[idx] in preserve:
+                it.setCheckState(0, Qt.Checked)
+                self._checked_search[keys[idx]] = name
+            else:
+                it.setCheckState(0, Qt.Unchecked)
+            batch.append(it)
+            add_row((it, src))
+        if batch:
+            # Painting stays off until _search_all_finished, so the whole
+            # search repaints once
+            self.search_results.addTopLevelItems(batch)
+            # Apply source filter immediately (hiding needs the item in the view)
+            sel = self.search_source_filter.currentText() if hasattr(self, 'search_source_filter') else 'All'
+            if sel in ('Pacman', 'Yay'):
+                for it, src in self._search_rows[-len(batch):]:
+                    if src != sel:
+                        it.setHidden(True)
+        if capped:
+            self._stop_search_at_cap(source)
+
+    def _stop_search_at_cap(self, source):
+        # Cap reached: stop both sources at once instead of letting the other
+        # keep streaming lines that would only be discarded
+        if self._search_truncated:
+            return
+        # Mark truncated and surface the See more button right away
+        self._search_truncated = True
+        try:
+            if hasattr(self, 'see_more_button'):
+                self.see_more_button.setVisible(True)
+        except Exception:
+            pass
+        for p in self._active_search_procs:
+            try:
+                # Finish is handled below, once, rather than per killed process
+                p.finished.disconnect()
+                if p.state() != QProcess.NotRunning:
+                    p.kill(); p.waitForFinished(100)
+            except Exception:
+                pass
+        self._search_gate.done()
 
     def _search_finished(self):
         # Kept for compatibility when using single-process path
@@ -1657,44 +2109,36 @@ class YayGUI(QWidget):
         self._search_one_finished('aur')
 
     def _search_one_finished(self, source):
-        # Flush pending desc for that source
-        ctx = self._search_ctx.get(source)
-        # Ensure last item's description captured for sidebar (no list column)
-        self._search_done[source] = True
-        if all(self._search_done.values()):
-            count = self.search_results.topLevelItemCount()
-            if count == 0:
-                self.status_bar.showMessage('No packages found.')
-            else:
-                msg = f'Found {count} package(s).'
-                if getattr(self, '_search_truncated', False):
-                    msg += ' (truncated)'
-                self.status_bar.showMessage(msg)
-            self.search_results.setSortingEnabled(True)
-            self._active_search_procs = []
-            # Re-enable updates and repaint once after bulk insert
-            try:
-                self.search_results.setUpdatesEnabled(True)
-                self.search_results.viewport().update()
-            except Exception:
-                pass
-            # If truncated, offer to load more
-            try:
-                if getattr(self, '_search_truncated', False):
-                    self.see_more_button.setVisible(True)
-            except Exception:
-                pass
+        self._search_gate.done(source)
 
-    def _see_more_clicked(self):
-        # Expand page and re-run search, preserving current checked selections
-        names = []
+    def _search_all_finished(self):
+        count = self.search_results.topLevelItemCount()
+        if count == 0:
+            self.status_bar.showMessage('No packages found.')
+        else:
+            msg = f'Found {count} package(s).'
+            if getattr(self, '_search_truncated', False):
+                msg += ' (truncated)'
+            self.status_bar.showMessage(msg)
+        self.search_results.setSortingEnabled(True)
+        self._restore_column_sizing(self.search_results)
+        self._active_search_procs = []
+        # Re-enable updates and repaint once after bulk insert
+        try:
+            self.search_results.setUpdatesEnabled(True)
+            self.search_results.viewport().update()
+        except Exception:
+            pass
+        # If truncated, offer to load more
         try:
-            for i in range(self.search_results.topLevelItemCount()):
-                it = self.search_results.topLevelItem(i)
-                if it.checkState(0) == Qt.Checked:
-                    names.append(it.text(1))
+            if getattr(self, '_search_truncated', False):
+                self.see_more_button.setVisible(True)
         except Exception:
             pass
+
+    def _see_more_clicked(self):
+        # Expand page and re-run search, preserving current checked selections
+        checked_keys = set(self._checked_search)
         try:
             self._search_page = int(getattr(self, '_search_page', 1)) + 1
         except Exception:
@@ -1702,7 +2146,7 @@ class YayGUI(QWidget):
         term = getattr(self, '_last_search_term', None) or self.search_input.text().strip()
         if not term:
             return
-        self._start_search(term, preserve_checked=set(names))
+        self._start_search(term, preserve_checked=checked_keys)
 
     # Apply source filter to search results
     def _apply_search_filter(self, *_):
@@ -1710,13 +2154,19 @@ class YayGUI(QWidget):
             sel = self.search_source_filter.currentText()
         except Exception:
             sel = 'All'
-        for i in range(self.search_results.topLevelItemCount()):
-            it = self.search_results.topLevelItem(i)
-            src = it.text(3)
-            hide = False
-            if sel in ('Pacman', 'Yay') and src != sel:
-                hide = True
-            it.setHidden(hide)
+        only_src = sel if sel in ('Pacman', 'Yay') else None
+        view = self.search_results
+        # One repaint for the whole pass instead of one per flipped row
+        view.setUpdatesEnabled(False)
+        try:
+            # Walk the Python-side rows; no item text is read back from Qt
+            for it, src in self._search_rows:
+                hide = only_src is not None and src != only_src
+                # Only touch rows whose visibility flips; each setHidden schedules a relayout
+                if it.isHidden() != hide:
+                    it.setHidden(hide)
+        finally:
+            view.setUpdatesEnabled(True)
 
     # ---- Installed ----
     def do_list_installed(self):
@@ -1729,7 +2179,10 @@ class YayGUI(QWidget):
                 pass
         self._active_inst_procs = []
         self.installed_view.clear()
+        self._installed_rows = []
+        self._checked_installed = {}
         self.installed_view.setSortingEnabled(False)
+        self._suspend_column_sizing(self.installed_view)
         try:
             if hasattr(self, 'installed_select_all_cb'):
                 self.installed_select_all_cb.setChecked(False)
@@ -1737,17 +2190,18 @@ class YayGUI(QWidget):
             pass
         self.installed_status.showMessage('Loading installed packages...')
         self._installed_count = 0
-        self._installed_done_native = False
-        self._installed_done_foreign = False
+        self._installed_gate = _Gate(('native', 'foreign'), self._installed_all_finished)
 
         # Explicit native (repo) packages
         p_native = QProcess(self)
         p_native.setProgram('pacman')
         p_native.setArguments(['--color', 'never', '-Qen'])
+        p_native.setProcessEnvironment(_query_env())
         p_native.setProcessChannelMode(QProcess.MergedChannels)
-        self._inst_source_by_proc[p_native] = 'Pacman'
-        p_native.readyReadStandardOutput.connect(lambda: self._collect_installed_output_stream2(p_native))
-        p_native.finished.connect(lambda _c=0, _s=0, p=p_native: self._installed_proc_finished(p, 'native'))
+        p_native.setProperty('source', 'Pacman')
+        p_native.setProperty('which', 'native')
+        p_native.readyReadStandardOutput.connect(self._on_installed_ready)
+        p_native.finished.connect(self._on_installed_finished)
         p_native.errorOccurred.connect(self._on_installed_error)
         self._active_inst_procs.append(p_native)
         p_native.start()
@@ -1756,111 +2210,124 @@ class YayGUI(QWidget):
         p_foreign = QProcess(self)
         p_foreign.setProgram('pacman')
         p_foreign.setArguments(['--color', 'never', '-Qem'])
+        p_foreign.setProcessEnvironment(_query_env())
         p_foreign.setProcessChannelMode(QProcess.MergedChannels)
-        self._inst_source_by_proc[p_foreign] = 'Yay'
-        p_foreign.readyReadStandardOutput.connect(lambda: self._collect_installed_output_stream2(p_foreign))
-        p_foreign.finished.connect(lambda _c=0, _s=0, p=p_foreign: self._installed_proc_finished(p, 'foreign'))
+        p_foreign.setProperty('source', 'Yay')
+        p_foreign.setProperty('which', 'foreign')
+        p_foreign.readyReadStandardOutput.connect(self._on_installed_ready)
+        p_foreign.finished.connect(self._on_installed_finished)
         p_foreign.errorOccurred.connect(self._on_installed_error)
         self._active_inst_procs.append(p_foreign)
         p_foreign.start()
 
-    def _collect_installed_output(self):
-        self.installed_buffer += bytes(self.installed_proc.readAllStandardOutput()).decode('utf-8', errors='ignore')
+    def _on_installed_ready(self):
+        self._collect_installed_output_stream2(self.sender())
 
-    def _installed_finished(self):
-        pkgs = parse_yay_installed(self.installed_buffer)
-        if not pkgs:
-            self.installed_status.showMessage('No explicitly installed packages found.')
-            return
-        for p in pkgs:
-            it = QTreeWidgetItem(self.installed_view)
-            it.setText(0, '')
-            it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
-            it.setCheckState(0, Qt.Unchecked)
-            it.setText(1, p['name'])
-            it.setText(2, p['version'])
-        self.installed_status.showMessage(f'Found {len(pkgs)} package(s).')
+    def _on_installed_finished(self, *_):
+        proc = self.sender()
+        self._installed_proc_finished(proc, proc.property('which'))
 
     def _collect_installed_output_stream2(self, proc):
-        chunk = bytes(proc.readAllStandardOutput()).decode('utf-8', errors='ignore')
-        if not chunk:
+        lines = read_complete_lines(proc)
+        if not lines:
             return
-        buf = (self._inst_pending.get(proc, '') or '') + chunk
-        lines = buf.split('\n')
-        self._inst_pending[proc] = lines.pop()  # keep tail
-        source_label = self._inst_source_by_proc.get(proc, '')
+        source_label = proc.property('source') or ''
+        # Build this chunk's rows detached, then insert them in one call
+        batch = []
+        add_row = self._installed_rows.append
+        add_item = batch.append
+        room = self._installed_max_items - self.installed_view.topLevelItemCount()
         for raw in lines:
-            line = clean_control_codes(raw).strip()
+            if len(batch) >= room:
+                break
+            line = raw.strip()
             if not line:
                 continue
-            parts = line.split()
-            if len(parts) < 2:
+            # -Q prints "name version": cut at the first space, no token list
+            name, _, ver = line.partition(' ')
+            ver = ver.strip()
+            if not ver:
                 continue
-            if self.installed_view.topLevelItemCount() >= self._installed_max_items:
-                continue
-            it = QTreeWidgetItem(self.installed_view)
-            it.setText(0, '')
-            it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
+            it = QTreeWidgetItem(['', name, ver, source_label])
             it.setCheckState(0, Qt.Unchecked)
-            it.setText(1, parts[0])
-            it.setText(2, parts[1])
-            it.setText(3, source_label)
-            self._installed_count += 1
-        self.installed_status.showMessage(f'Loaded {self._installed_count} installed package(s)...')
-        # Re-apply filter if user picked a source/text filter
-        try:
-            self._filter_installed_list(self.installed_filter.text())
-        except Exception:
-            pass
+            add_item(it)
+            add_row((it, f"{name} {ver}".lower(), source_label))
+        if batch:
+            # Suspend repaints while this chunk's rows go in: one repaint per chunk
+            self.installed_view.setUpdatesEnabled(False)
+            try:
+                self.installed_view.addTopLevelItems(batch)
+            finally:
+                self.installed_view.setUpdatesEnabled(True)
+            self._installed_count += len(batch)
+            # Apply the current filter to this chunk's rows only; earlier rows
+            # already have the right visibility
+            try:
+                self._filter_installed_list(rows=self._installed_rows[-len(batch):])
+            except Exception:
+                pass
+        if not self._installed_status_timer.isActive():
+            self._installed_status_timer.start()
 
     def _installed_proc_finished(self, proc, which):
         # Flush tail for this proc
-        tail = clean_control_codes(self._inst_pending.get(proc, '') or '').strip()
-        self._inst_pending[proc] = ''
+        tail = ''.join(read_complete_lines(proc, final=True)).strip()
         if tail:
-            parts = tail.split()
-            if len(parts) >= 2 and self.installed_view.topLevelItemCount() < self._installed_max_items:
-                it = QTreeWidgetItem(self.installed_view)
-                it.setText(0, '')
-                it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
+            name, _, ver = tail.partition(' ')
+            ver = ver.strip()
+            if ver and self.installed_view.topLevelItemCount() < self._installed_max_items:
+                src_label = proc.property('source') or ''
+                it = QTreeWidgetItem(self.installed_view, ['', name, ver, src_label])
                 it.setCheckState(0, Qt.Unchecked)
-                it.setText(1, parts[0])
-                it.setText(2, parts[1])
-                src_label = self._inst_source_by_proc.get(proc, '')
-                it.setText(3, src_label)
+                self._installed_rows.append((it, f"{name} {ver}".lower(), src_label))
                 self._installed_count += 1
-        if which == 'native':
-            self._installed_done_native = True
-        else:
-            self._installed_done_foreign = True
-        if getattr(self, '_installed_done_native', False) and getattr(self, '_installed_done_foreign', False):
-            if self._installed_count == 0:
-                self.installed_status.showMessage('No explicitly installed packages found.')
-            else:
-                self.installed_status.showMessage(f'Found {self._installed_count} package(s).')
-            self.installed_view.setSortingEnabled(True)
+                try:
+                    self._filter_installed_list(rows=self._installed_rows[-1:])
+                except Exception:
+                    pass
+        self._installed_gate.done(which)
+
+    def _show_installed_progress(self):
+        self.installed_status.showMessage(f'Loaded {self._installed_count} installed package(s)...')
 
-    def _filter_installed_list(self, text):
-        q = (text or '').strip().lower()
+    def _installed_all_finished(self):
+        self._installed_status_timer.stop()
+        if self._installed_count == 0:
+            self.installed_status.showMessage('No explicitly installed packages found.')
+        else:
+            self.installed_status.showMessage(f'Found {self._installed_count} package(s).')
+        self.installed_view.setSortingEnabled(True)
+        self._restore_column_sizing(self.installed_view)
+
+    def _queue_installed_filter(self, *_):
+        # Restart the debounce timer on each keystroke
+        self._installed_filter_timer.start()
+
+    def _filter_installed_list(self, *_, rows=None):
+        # Always read the filter text from the field; the source combo also
+        # triggers this and passes its own text as the signal argument.
+        # rows limits the pass to newly streamed rows (default: all of them).
+        q = (self.installed_filter.text() or '').strip().lower()
         sel = 'All'
         try:
             sel = self.installed_source_filter.currentText()
         except Exception:
             pass
-        for i in range(self.installed_view.topLevelItemCount()):
-            it = self.installed_view.topLevelItem(i)
-            hay = f"{it.text(1)} {it.text(2)}".lower()
-            visible = True
-            if q and q not in hay:
-                visible = False
-            if sel in ('Pacman', 'Yay') and (it.text(3) != sel):
-                visible = False
-            it.setHidden(not visible)
+        only_src = sel if sel in ('Pacman', 'Yay') else None
+        # Walk the Python-side rows; no item text is read back from Qt
+        self.installed_view.setUpdatesEnabled(False)
+        try:
+            for it, hay, src in (self._installed_rows if rows is None else rows):
+                visible = (not q or q in hay) and (not only_src or src == only_src)
+                if it.isHidden() == visible:
+                    it.setHidden(not visible)
+        finally:
+            self.installed_view.setUpdatesEnabled(True)
 
     # ---- Updates ----
     def do_list_updates(self):
         # Cancel running processes if any
-        for proc in getattr(self, '_active_upd_procs', []):
+        for proc in self._active_upd_procs:
             try:
                 if proc.state() != QProcess.NotRunning:
                     proc.kill(); proc.waitForFinished(1000)
@@ -1871,10 +2338,8 @@ class YayGUI(QWidget):
         # Reset state and UI
         self.updates_view.clear()
         self.updates_view.setSortingEnabled(False)
-        self._repo_pending = ''
-        self._aur_pending = ''
-        self._repo_done = False
-        self._aur_done = False
+        self._suspend_column_sizing(self.updates_view)
+        self._updates_gate = _Gate(('repo', 'aur'), self._updates_all_finished)
         self._repo_count = 0
         self._aur_count = 0
         self.update_status.showMessage('Checking for updates...')
@@ -1886,153 +2351,202 @@ class YayGUI(QWidget):
 
         # Reset seen set for deduplication
         self._updates_seen = set()
+        self._update_rows = []
+        self._update_filter_q = None
 
-        # Start repo updates via pacman only (avoid AUR duplication)
+        # Both queries start right away so total wait is max(repo, AUR), not the sum.
+        # Start repo updates via pacman only (avoid AUR duplication). -Qu only
+        # reads the local sync DBs, so it never touches the network.
         repo = QProcess(self)
         repo.setProgram('pacman')
         repo.setArguments(['--color', 'never', '-Qu'])
+        repo.setProcessEnvironment(_query_env())
         repo.setProcessChannelMode(QProcess.MergedChannels)
-        repo.readyReadStandardOutput.connect(lambda: self._collect_updates_output_stream('repo', repo))
-        repo.finished.connect(lambda _c=0, _s=0: self._updates_one_finished('repo'))
+        repo.setProperty('source', 'repo')
+        repo.readyReadStandardOutput.connect(self._on_updates_ready)
+        repo.finished.connect(self._on_updates_finished)
         repo.errorOccurred.connect(self._on_repo_updates_error)
         self._active_upd_procs.append(repo)
         repo.start()
 
-        # Start AUR updates (AUR only)
+        # Start AUR updates (AUR only). --nodevel skips polling every VCS
+        # (-git) upstream, which can take far longer than the AUR RPC query.
         aur = QProcess(self)
         aur.setProgram('yay')
-        aur.setArguments(['--color=never', '-Qua'])
+        aur.setArguments(['--color=never', '-Qua', '--nodevel'])
+        aur.setProcessEnvironment(_query_env())
         aur.setProcessChannelMode(QProcess.MergedChannels)
-        aur.readyReadStandardOutput.connect(lambda: self._collect_updates_output_stream('aur', aur))
-        aur.finished.connect(lambda _c=0, _s=0: self._updates_one_finished('aur'))
+        aur.setProperty('source', 'aur')
+        aur.readyReadStandardOutput.connect(self._on_updates_ready)
+        aur.finished.connect(self._on_updates_finished)
         aur.errorOccurred.connect(self._on_aur_updates_error)
         self._active_upd_procs.append(aur)
         aur.start()
 
+    def _on_updates_ready(self):
+        proc = self.sender()
+        self._collect_updates_output_stream(proc.property('source'), proc)
+
+    def _on_updates_finished(self, *_):
+        self._updates_one_finished(self.sender().property('source'))
+
     def _collect_updates_output_stream(self, source, proc):
-        chunk = bytes(proc.readAllStandardOutput()).decode('utf-8', errors='ignore')
-        if not chunk:
+        lines = read_complete_lines(proc)
+        if not lines:
             return
-        if source == 'repo':
-            self._repo_pending += chunk
-            buf = self._repo_pending
-            lines = buf.split('\n')
-            self._repo_pending = lines.pop()
-        else:
-            self._aur_pending += chunk
-            buf = self._aur_pending
-            lines = buf.split('\n')
-            self._aur_pending = lines.pop()
+        src_label = 'Pacman' if source == 'repo' else 'Yay'
+        batch = []
+        seen = self._updates_seen
+        mark_seen = seen.add
+        add_row = self._update_rows.append
         for raw in lines:
-            line = clean_control_codes(raw.rstrip('\r')).strip()
+            line = raw.strip()
             if not line or line.startswith('::'):
                 continue
-            m = self._upd_line_re.match(line)
-            if not m:
+            # One partition on the arrow instead of a regex match per line
+            left, sep, right = line.partition(' -> ')
+            if not sep:
                 continue
-            name = m.group('name')
-            key = (source, name)
-            if key in self._updates_seen:
+            lparts = left.split()
+            rparts = right.split()
+            # Only plain "name old -> new" rows; skips e.g. "[ignored]" entries
+            if len(lparts) != 2 or len(rparts) != 1:
+                continue
+            name, old = lparts
+            new = rparts[0]
+            # Keyed by name alone so a package reported by both pacman and
+            # yay (e.g. a yay -Qu without --aur) is only listed once
+            if name in seen:
                 continue
-            self._updates_seen.add(key)
-            it = QTreeWidgetItem(self.updates_view)
-            it.setText(0, '')
-            it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
+            mark_seen(name)
+            it = QTreeWidgetItem(['', name, old, new, src_label])
             it.setCheckState(0, Qt.Unchecked)
-            it.setText(1, name)
-            it.setText(2, m.group('old'))
-            it.setText(3, m.group('new'))
-            src_label = 'Pacman' if source == 'repo' else 'Yay'
-            it.setText(4, src_label)
-            # Apply source filter immediately
+            add_row((it, f"{name} {old} {new}".lower(), src_label))
+            batch.append(it)
+        if not batch:
+            return
+        self._update_filter_q = None  # new rows: next filter pass must be a full one
+        self.updates_view.setUpdatesEnabled(False)
+        try:
+            self.updates_view.addTopLevelItems(batch)
+            # Apply source filter immediately (hiding needs the item in the view)
             try:
                 sel = self.updates_source_filter.currentText()
             except Exception:
                 sel = 'All'
             if sel in ('Pacman', 'Yay') and src_label != sel:
-                it.setHidden(True)
-            if source == 'repo':
-                self._repo_count += 1
-            else:
-                self._aur_count += 1
-            self.update_status.showMessage(f"Updates: Repo {self._repo_count}, AUR {self._aur_count} (loading...)")
+                for it in batch:
+                    it.setHidden(True)
+        finally:
+            self.updates_view.setUpdatesEnabled(True)
+        if source == 'repo':
+            self._repo_count += len(batch)
+        else:
+            self._aur_count += len(batch)
+        if not self._updates_status_timer.isActive():
+            self._updates_status_timer.start()
 
     def _updates_one_finished(self, source):
-        if source == 'repo':
-            self._repo_done = True
+        self._updates_gate.done(source)
+
+    def _show_updates_progress(self):
+        self.update_status.showMessage(f"Updates: Repo {self._repo_count}, AUR {self._aur_count} (loading...)")
+
+    def _updates_all_finished(self):
+        self._updates_status_timer.stop()
+        total = self._repo_count + self._aur_count
+        if total == 0:
+            self.update_status.showMessage('No updates available.')
         else:
-            self._aur_done = True
-        if self._repo_done and self._aur_done:
-            total = self._repo_count + self._aur_count
-            if total == 0:
-                self.update_status.showMessage('No updates available.')
-            else:
-                self.update_status.showMessage(f'Found {total} update(s): {self._repo_count} repo, {self._aur_count} AUR.')
-            # Re-enable sorting now that we are done
-            self.updates_view.setSortingEnabled(True)
-            try:
-                title = 'Update' if total <= 0 else f'Update ({total})'
-                self.tabs.setTabText(self.update_tab_index, title)
-            except Exception:
-                pass
+            self.update_status.showMessage(f'Found {total} update(s): {self._repo_count} repo, {self._aur_count} AUR.')
+        # Re-enable sorting now that we are done
+        self.updates_view.setSortingEnabled(True)
+        self._restore_column_sizing(self.updates_view)
+        try:
+            title = 'Update' if total <= 0 else f'Update ({total})'
+            self.tabs.setTabText(self.update_tab_index, title)
+        except Exception:
+            pass
+
+    def _queue_updates_filter(self, *_):
+        self._update_filter_timer.start()
 
-    def _filter_updates_list(self, text):
-        q = (text or '').strip().lower()
+    def _filter_updates_list(self, *_):
+        q = (self.update_filter.text() or '').strip().lower()
         try:
             sel = self.updates_source_filter.currentText()
         except Exception:
             sel = 'All'
-        for i in range(self.updates_view.topLevelItemCount()):
-            it = self.updates_view.topLevelItem(i)
-            # Match in name, current, new (not source), then apply source filter separately
-            hay = ' '.join([
-                it.text(1), it.text(2), it.text(3)
-            ]).lower()
-            visible = True
-            if q and q not in hay:
-                visible = False
-            if sel in ('Pacman', 'Yay') and (it.text(4) != sel):
-                visible = False
-            it.setHidden(not visible)
+        only_src = sel if sel in ('Pacman', 'Yay') else None
+        rows = self._update_rows
+        prev_q = self._update_filter_q
+        if q and prev_q and prev_q in q:
+            # The query only grew (typing more characters): rows that failed the
+            # previous text test cannot match now and are already hidden, so
+            # re-test just the previous matches
+            candidates = self._update_filter_hits
+        else:
+            candidates = range(len(rows))
+        hits = []
+        self.updates_view.setUpdatesEnabled(False)
+        try:
+            for i in candidates:
+                it, hay, src = rows[i]
+                # Match in name, current, new (not source), then apply source filter separately
+                visible = not q or q in hay
+                if visible:
+                    hits.append(i)
+                if only_src and src != only_src:
+                    visible = False
+                if it.isHidden() == visible:
+                    it.setHidden(not visible)
+        finally:
+            self.updates_view.setUpdatesEnabled(True)
+        self._update_filter_q = q
+        self._update_filter_hits = hits
 
     def _toggle_select_all(self, checked: bool):
         # Toggle selection for all visible rows
         state = Qt.Checked if checked else Qt.Unchecked
-        for i in range(self.updates_view.topLevelItemCount()):
-            it = self.updates_view.topLevelItem(i)
-            if not it.isHidden():
-                it.setCheckState(0, state)
+        self.updates_view.setUpdatesEnabled(False)
+        try:
+            for i in range(self.updates_view.topLevelItemCount()):
+                it = self.updates_view.topLevelItem(i)
+                if not it.isHidden():
+                    it.setCheckState(0, state)
+        finally:
+            self.updates_view.setUpdatesEnabled(True)
 
     def _toggle_select_all_installed(self, checked: bool):
         # Toggle selection for all visible rows in the Installed tab
         state = Qt.Checked if checked else Qt.Unchecked
-        for i in range(self.installed_view.topLevelItemCount()):
-            it = self.installed_view.topLevelItem(i)
-            if not it.isHidden():
-                it.setCheckState(0, state)
+        self.installed_view.setUpdatesEnabled(False)
+        try:
+            for i in range(self.installed_view.topLevelItemCount()):
+                it = self.installed_view.topLevelItem(i)
+                if not it.isHidden():
+                    it.setCheckState(0, state)
+        finally:
+            self.installed_view.setUpdatesEnabled(True)
 
     def do_update_selected(self):
         names = []
-        for i in range(self.updates_view.topLevelItemCount()):
-            it = self.updates_view.topLevelItem(i)
-            if it.checkState(0) == Qt.Checked:
-                names.append(it.text(1))
+        repo_names = []
+        aur_names = []
+        # One walk over only the checked rows (the iterator skips the rest on
+        # the C++ side), splitting by the source in column 4 as it goes
+        it_iter = QTreeWidgetItemIterator(self.updates_view, QTreeWidgetItemIterator.Checked)
+        while it_iter.value():
+            it = it_iter.value()
+            name = it.text(1)
+            names.append(name)
+            (repo_names if it.text(4) == 'Pacman' else aur_names).append(name)
+            it_iter += 1
         if not names:
             QMessageBox.information(self, 'Nothing selected', 'Select at least one package to update.')
             return
-        cmd = f"yay -S --needed {' '.join(names)}"
-        if QMessageBox.question(self, 'Confirm update', f"Run:\n{cmd}") != QMessageBox.Yes:
+        if QMessageBox.question(self, 'Confirm update', f"Run:\nyay -S --needed {preview_names(names)}") != QMessageBox.Yes:
             return
-        repo_names = []
-        aur_names = []
-        # Determine sources from column 4
-        for i in range(self.updates_view.topLevelItemCount()):
-            it = self.updates_view.topLevelItem(i)
-            if it.checkState(0) == Qt.Checked:
-                if it.text(4).lower().startswith('pacman'):
-                    repo_names.append(it.text(1))
-                else:
-                    aur_names.append(it.text(1))
         yay_ok = self._is_yay_usable()
         if not yay_ok:
             if not repo_names:
@@ -2042,34 +2556,26 @@ class YayGUI(QWidget):
                 if QMessageBox.question(self, 'Yay unavailable', 'Yay is not available. Proceed with repo updates only via pacman?') != QMessageBox.Yes:
                     return
             # Run repo-only via pacman in Konsole (or fallback terminal)
-            pcmd = f"sudo pacman -S --needed {' '.join(repo_names)}"
             try:
-                if shutil.which('konsole'):
+                if self.term.has_konsole:
                     self.term.run_konsole_direct(['sudo', 'pacman', '-S', '--needed', *repo_names], keep_open=self.keep_konsole_open)
                 else:
-                    self.term.run(pcmd)
+                    self.term.run(f"sudo pacman -S --needed {shlex.join(repo_names)}")
             except Exception as e:
                 QMessageBox.critical(self, 'Terminal error', str(e))
             return
         # yay is usable: split by source to prefer pacman for repo
-        cmds_text = []
+        cmds = []
         if repo_names:
-            cmds_text.append(f"sudo pacman -S --needed {' '.join(repo_names)}")
+            cmds.append(('sudo pacman -S --needed', repo_names))
         if aur_names:
-            cmds_text.append(f"yay -S --needed {' '.join(aur_names)}")
-        if not cmds_text:
+            cmds.append(('yay -S --needed', aur_names))
+        if not cmds:
             QMessageBox.information(self, 'Nothing selected', 'No packages selected to update.')
             return
         # We've already asked confirmation above; run
         try:
-            if shutil.which('konsole'):
-                if repo_names:
-                    self.term.run_konsole_direct(['sudo', 'pacman', '-S', '--needed', *repo_names], keep_open=self.keep_konsole_open)
-                if aur_names:
-                    self.term.run_konsole_direct(['yay', '-S', '--needed', *aur_names], keep_open=self.keep_konsole_open)
-            else:
-                for cmdline in cmds_text:
-                    self.term.run(cmdline)
+            self._run_cmds(cmds)
         except Exception as e:
             QMessageBox.critical(self, 'Terminal error', str(e))
 
@@ -2083,7 +2589,7 @@ class YayGUI(QWidget):
             if QMessageBox.question(self, 'Yay unavailable', 'Yay is not available. Run repo update only via pacman?') != QMessageBox.Yes:
                 return
             try:
-                if shutil.which('konsole'):
+                if self.term.has_konsole:
                     self.term.run_konsole_direct(['sudo', 'pacman', '-Syu'], keep_open=self.keep_konsole_open)
                 else:
                     self.term.run(pcmd)
@@ -2091,7 +2597,7 @@ class YayGUI(QWidget):
                 QMessageBox.critical(self, 'Terminal error', str(e))
             return
         try:
-            if shutil.which('konsole'):
+            if self.term.has_konsole:
                 self.term.run_konsole_direct(['yay', '-Syu'], keep_open=self.keep_konsole_open)
             else:
                 self.term.run(cmd)
@@ -2099,113 +2605,251 @@ class YayGUI(QWidget):
             QMessageBox.critical(self, 'Terminal error', str(e))
 
     # ---- Actions ----
+    def _on_search_current_changed(self, current, _previous):
+        # Keyboard navigation; cached/inline details still render immediately
+        if current is not None:
+            self._show_pkg_info(current, 1)
+
     def _show_pkg_info(self, item, _col):
-        data = item.data(1, Qt.UserRole)
-        if not data:
+        idx = self.pkgs.index_of(item)
+        if idx is None:
             return
-        desc = data.get('description', '').strip()
-        key = f"{data.get('repo', '')}/{data.get('name', '')}"
+        # Same key as _fetch_pkg_details so finished fetches match up
+        key = self.pkgs.keys[idx]
+        if key != self._current_info_key:
+            self._cancel_stale_fetches(key)
         self._current_info_key = key
 
-        if desc:
-            url = data.get('url', '')
-            link = f" &nbsp; <b>URL:</b> <a href=\"{url}\">{url}</a>" if url else ''
-            details = (
-                f"<h3>{data['name']}</h3>"
-                f"<p>{desc}</p>"
-                f"<p><b>Repo:</b> {data['repo']} &nbsp; <b>Version:</b> {data['version']}{link}</p>"
-            )
-            self.sidebar_text.setHtml(details)
+        if self.pkgs.descs[idx].strip():
+            self._render_sidebar(idx)
             return
 
-        # No description parsed from search output — fetch details via -Si
-        self.sidebar_text.setHtml(
-            f"<h3>{data['name']}</h3><p>Fetching description…</p>"
-        )
+        # Re-clicks, rows from a fresh search and earlier sessions reuse a
+        # -Si result as long as it was fetched for this version
+        cached = self._info_cache.get(key)
+        if cached is not None and cached[2] == self.pkgs.version_of(idx):
+            self._info_cache.move_to_end(key)
+            self._apply_pkg_details(key, idx, cached[0], cached[1])
+            return
+
+        # No description parsed from search output — fetch details via -Si.
+        # Queue first so only one of the two messages is ever rendered.
         try:
-            self._fetch_pkg_details(data)
+            fetching = self._fetch_pkg_details(idx)
         except Exception as e:
-            # Fall back to plain message
-            self.sidebar_text.setHtml(
-                f"<h3>{data['name']}</h3><p>No description available.</p>"
-            )
+            fetching = False
             self.status_bar.showMessage(f'Info fetch error: {e}')
+        if fetching:
+            self._render_sidebar(idx, 'Fetching description…')
+        else:
+            # Fall back to plain message
+            self._render_sidebar(idx, 'No description available.')
 
-    def _fetch_pkg_details(self, data):
-        name = data.get('name')
-        repo = (data.get('repo') or '').lower()
+    def _fetch_pkg_details(self, idx):
+        # Returns True when details for this package are on their way
+        name = self.pkgs.names[idx]
         if not name:
-            return
-        key = f"{repo}/{name}"
+            return False
+        key = self.pkgs.keys[idx]
         if key in self._info_procs:
             # Already fetching
+            return True
+        self._info_pending = (key, idx)
+        self._info_flush_timer.start()
+        return True
+
+    def _flush_info_requests(self):
+        pending = self._info_pending
+        self._info_pending = None
+        if pending is None:
             return
+        key, idx = pending
+        pkgs = self.pkgs
+        # A new search may have reused the index for another package
+        if pkgs.keys[idx:idx + 1] != [key] or key in self._info_procs:
+            return
+        name = pkgs.names[idx]
         proc = QProcess(self)
-        if repo == 'aur':
+        if pkgs.repos[idx].lower() == 'aur':
             proc.setProgram('yay')
             proc.setArguments(['--color=never', '-Si', name, '--aur'])
         else:
             proc.setProgram('pacman')
             proc.setArguments(['--color', 'never', '-Si', name])
-        proc.setProcessChannelMode(QProcess.MergedChannels)
-        self._info_buffers[key] = ''
-        proc.readyReadStandardOutput.connect(lambda: self._collect_info_output(key, proc))
-        proc.finished.connect(lambda _c=0, _s=0, k=key, d=data: self._info_finished(k, d))
-        proc.errorOccurred.connect(self._on_info_error)
+        proc.setProcessEnvironment(_query_env())
+        # Only stdout is parsed; drop stderr (lock warnings, progress) at the source
+        proc.setProcessChannelMode(QProcess.SeparateChannels)
+        proc.setStandardErrorFile(QProcess.nullDevice())
+        self._info_fetches[proc] = _InfoFetch(proc, name, key, idx)
         self._info_procs[key] = proc
+        # Bound slots shared by every fetch; the process comes from sender()
+        proc.readyReadStandardOutput.connect(self._collect_info_output)
+        proc.finished.connect(self._info_finished)
+        proc.errorOccurred.connect(self._on_info_error)
         proc.start()
 
-    def _collect_info_output(self, key, proc):
-        chunk = bytes(proc.readAllStandardOutput()).decode('utf-8', errors='ignore')
-        if not chunk:
+    def _collect_info_output(self):
+        proc = self.sender()
+        # Append raw bytes; decoding waits until the whole output is in
+        fetch = self._info_fetches.get(proc)
+        if fetch is not None:
+            fetch.buf.extend(proc.readAllStandardOutput().data())
+
+    def _info_finished(self, *_):
+        proc = self.sender()
+        fetch = self._info_fetches.pop(proc, None)
+        if fetch is None:
+            return
+        proc.deleteLater()
+        key, idx = fetch.key, fetch.idx
+        if self._info_procs.get(key) is proc:
+            del self._info_procs[key]
+        try:
+            # Decoded once, after the whole output is in
+            records = parse_si_records(fetch.buf)
+        except Exception:
+            records = {}
+        desc, url = records.get(fetch.name, ('', ''))
+        # Empty results are not cached so a failed fetch can be retried.
+        # Rows replaced by a newer search have no version to record.
+        if (desc or url) and self.pkgs.keys[idx:idx + 1] == [key]:
+            self._info_cache[key] = (desc, url, self.pkgs.version_of(idx))
+            self._info_cache.move_to_end(key)
+            self._info_cache_dirty = True
+            while len(self._info_cache) > self._info_cache_max:
+                self._info_cache.popitem(last=False)
+        if self._info_cache_dirty and not self._info_cache_save_timer.isActive():
+            self._info_cache_save_timer.start()
+        self._apply_pkg_details(key, idx, desc, url)
+
+    def _save_info_cache(self):
+        if not self._info_cache_dirty:
             return
-        self._info_buffers[key] = self._info_buffers.get(key, '') + chunk
-
-    def _info_finished(self, key, data):
-        buf = self._info_buffers.pop(key, '')
-        proc = self._info_procs.pop(key, None)
         try:
-            desc, url = parse_si_desc_url(buf)
-        except Exception:
-            desc, url = '', ''
-        # Update data so subsequent clicks are instant
+            save_si_cache(self._info_cache)
+            self._info_cache_dirty = False
+        except Exception as e:
+            self.status_bar.showMessage(f'Could not save description cache: {e}')
+
+    def _cancel_stale_fetches(self, key):
+        # Only the package on display still matters: drop a queued request and
+        # kill running fetches that are not for it, so they stop competing
+        # for CPU and the pacman DB
+        if self._info_pending is not None and self._info_pending[0] != key:
+            self._info_pending = None
+        for proc, fetch in list(self._info_fetches.items()):
+            if fetch.key == key:
+                continue
+            try:
+                proc.finished.disconnect()
+                proc.readyReadStandardOutput.disconnect()
+                # kill() emits errorOccurred(Crashed); this cancel is ours
+                proc.errorOccurred.disconnect()
+                if proc.state() != QProcess.NotRunning:
+                    proc.kill(); proc.waitForFinished(100)
+            except Exception:
+                pass
+            self._drop_info_proc(proc)
+
+    def _drop_info_proc(self, proc):
+        # Forget a -Si process and free its key for new requests; returns
+        # its _InfoFetch (None if it was already forgotten)
+        fetch = self._info_fetches.pop(proc, None)
+        if fetch is not None and self._info_procs.get(fetch.key) is proc:
+            del self._info_procs[fetch.key]
+        proc.deleteLater()
+        return fetch
+
+    def _apply_pkg_details(self, key, idx, desc, url):
+        pkgs = self.pkgs
+        # A new search may have reused the index for another package
+        if idx >= len(pkgs.keys) or pkgs.keys[idx] != key:
+            return
+        # Store on the row so subsequent clicks are instant
         if desc:
-            data['description'] = desc
+            pkgs.descs[idx] = desc
         if url:
-            data['url'] = url
-        # If user is still viewing this package, refresh the sidebar
-        if key == self._current_info_key:
-            d = data
-            desc_disp = d.get('description', '').strip() or 'No description available.'
-            url_disp = d.get('url', '')
-            link = f" &nbsp; <b>URL:</b> <a href=\"{url_disp}\">{url_disp}</a>" if url_disp else ''
-            details = (
-                f"<h3>{d['name']}</h3>"
-                f"<p>{desc_disp}</p>"
-                f"<p><b>Repo:</b> {d['repo']} &nbsp; <b>Version:</b> {d['version']}{link}</p>"
-            )
-            self.sidebar_text.setHtml(details)
+            pkgs.urls[idx] = url
+        # Fetches for packages the user has already left build no HTML at all
+        if key != self._current_info_key:
+            return
+        self._render_sidebar(idx)
+
+    def _render_sidebar(self, idx, message=None):
+        # Single place that builds sidebar HTML. Package text is escaped so a
+        # '<' or '&' in a description shows as-is instead of being parsed.
+        esc = html.escape
+        pkgs = self.pkgs
+        name = esc(pkgs.names[idx])
+        if message is not None:
+            self._set_sidebar_html(f"<h3>{name}</h3><p>{esc(message)}</p>")
+            return
+        desc = pkgs.descs[idx].strip() or 'No description available.'
+        url = esc(pkgs.urls[idx])
+        link = _SIDEBAR_LINK.format(url) if url else ''
+        self._set_sidebar_html(_SIDEBAR_HTML.format(
+            name=name,
+            desc=esc(desc),
+            repo=esc(pkgs.repos[idx]),
+            version=esc(pkgs.versions[idx]),
+            link=link,
+        ))
+
+    def _set_sidebar_html(self, text):
+        # setHtml re-parses and re-lays out the whole document; skip it when
+        # the same content is already shown (e.g. clicking the same row again)
+        if text == self._sidebar_html:
+            return
+        self._sidebar_html = text
+        self.sidebar_text.setHtml(text)
+
+    def _on_search_item_changed(self, item, col):
+        if col != 0:
+            return
+        idx = self.pkgs.index_of(item)
+        if idx is None:
+            return
+        key = self.pkgs.keys[idx]
+        if item.checkState(0) == Qt.Checked:
+            self._checked_search[key] = self.pkgs.names[idx]
+        else:
+            self._checked_search.pop(key, None)
+
+    def _on_installed_item_changed(self, item, col):
+        if col != 0:
+            return
+        name = item.text(1)
+        if item.checkState(0) == Qt.Checked:
+            self._checked_installed[name] = item.text(3)
+        else:
+            self._checked_installed.pop(name, None)
+
+    def _run_cmds(self, cmds):
+        # Every (prefix, packages) step goes to one terminal window, chained
+        # with ; so each step still runs whether or not the previous one
+        # succeeded, as it did when every step had its own window
+        if self.term.has_konsole and len(cmds) == 1:
+            prefix, pkgs = cmds[0]
+            # Konsole takes the argv directly; no shell, nothing to quote
+            self.term.run_konsole_direct([*prefix.split(), *pkgs], keep_open=self.keep_konsole_open)
+            return
+        script = '; '.join(f"{prefix} {shlex.join(pkgs)}" for prefix, pkgs in cmds)
+        if self.term.has_konsole:
+            self.term.run_konsole_direct(['bash', '-c', script], keep_open=self.keep_konsole_open)
+        else:
+            self.term.run(script)
 
     def do_install(self):
-        names = []
-        for i in range(self.search_results.topLevelItemCount()):
-            it = self.search_results.topLevelItem(i)
-            if it.checkState(0) == Qt.Checked:
-                names.append(it.text(1))
-        if not names:
+        if not self._checked_search:
             QMessageBox.information(self, 'Nothing selected', 'Select at least one package to install.')
             return
-        # Split into repo vs AUR
+        # Split into repo vs AUR by the 'repo/name' key: one pass, then sort
         repo_names = []
         aur_names = []
-        for i in range(self.search_results.topLevelItemCount()):
-            it = self.search_results.topLevelItem(i)
-            if it.checkState(0) == Qt.Checked:
-                data = it.data(1, Qt.UserRole) or {}
-                if (data.get('repo') or '').lower() == 'aur':
-                    aur_names.append(it.text(1))
-                else:
-                    repo_names.append(it.text(1))
+        for key, name in self._checked_search.items():
+            (aur_names if key.startswith('aur/') else repo_names).append(name)
+        repo_names.sort()
+        aur_names.sort()
         yay_ok = self._is_yay_usable()
         if not yay_ok:
             # Offer to install repo packages with pacman
@@ -2215,88 +2859,69 @@ class YayGUI(QWidget):
             if aur_names:
                 if QMessageBox.question(self, 'Yay unavailable', 'Yay is not available. Proceed with repo packages only via pacman?') != QMessageBox.Yes:
                     return
-            pcmd = f"sudo pacman -S --needed {' '.join(repo_names)}"
             try:
-                if shutil.which('konsole'):
+                if self.term.has_konsole:
                     self.term.run_konsole_direct(['sudo', 'pacman', '-S', '--needed', *repo_names], keep_open=self.keep_konsole_open)
                 else:
-                    self.term.run(pcmd)
+                    self.term.run(f"sudo pacman -S --needed {shlex.join(repo_names)}")
             except Exception as e:
                 QMessageBox.critical(self, 'Terminal error', str(e))
             return
         # yay is usable. Prefer pacman for repo, yay for AUR.
-        cmds_text = []
+        cmds = []
         if repo_names:
-            cmds_text.append(f"sudo pacman -S --needed {' '.join(repo_names)}")
+            cmds.append(('sudo pacman -S --needed', repo_names))
         if aur_names:
-            cmds_text.append(f"yay -S {' '.join(aur_names)}")
-        if not cmds_text:
+            cmds.append(('yay -S --needed', aur_names))
+        if not cmds:
             QMessageBox.information(self, 'Nothing selected', 'Select at least one package to install.')
             return
-        if QMessageBox.question(self, 'Confirm install', "Run:\n" + "\n".join(cmds_text)) != QMessageBox.Yes:
+        # The dialog gets a short preview; the terminal gets the full lists
+        preview = '\n'.join(f"{prefix} {preview_names(pkgs)}" for prefix, pkgs in cmds)
+        if QMessageBox.question(self, 'Confirm install', "Run:\n" + preview) != QMessageBox.Yes:
             return
         try:
-            if shutil.which('konsole'):
-                if repo_names:
-                    self.term.run_konsole_direct(['sudo', 'pacman', '-S', '--needed', *repo_names], keep_open=self.keep_konsole_open)
-                if aur_names:
-                    self.term.run_konsole_direct(['yay', '-S', *aur_names], keep_open=self.keep_konsole_open)
-            else:
-                for cmdline in cmds_text:
-                    self.term.run(cmdline)
+            self._run_cmds(cmds)
         except Exception as e:
             QMessageBox.critical(self, 'Terminal error', str(e))
 
     def do_uninstall(self):
-        names = []
-        repo_names = []
-        aur_names = []
-        for i in range(self.installed_view.topLevelItemCount()):
-            it = self.installed_view.topLevelItem(i)
-            if it.checkState(0) == Qt.Checked:
-                names.append(it.text(1))
-                src = (it.text(3) or '').lower()
-                if src.startswith('pacman'):
-                    repo_names.append(it.text(1))
-                else:
-                    aur_names.append(it.text(1))
-        if not names:
+        checked = self._checked_installed
+        if not checked:
             QMessageBox.information(self, 'Nothing selected', 'Select at least one package to uninstall.')
             return
-        # If yay not usable, run everything via pacman
+        names = sorted(checked)
+        # If yay not usable, run everything via pacman (no source split needed)
         if not self._is_yay_usable():
-            pcmd = f"sudo pacman -Rns {' '.join(names)}"
-            if QMessageBox.question(self, 'Yay unavailable', f"Run via pacman instead?\n{pcmd}") != QMessageBox.Yes:
+            if QMessageBox.question(self, 'Yay unavailable', f"Run via pacman instead?\nsudo pacman -Rns {preview_names(names)}") != QMessageBox.Yes:
                 return
             try:
-                if shutil.which('konsole'):
+                if self.term.has_konsole:
                     self.term.run_konsole_direct(['sudo', 'pacman', '-Rns', *names], keep_open=self.keep_konsole_open)
                 else:
-                    self.term.run(pcmd)
+                    self.term.run(f"sudo pacman -Rns {shlex.join(names)}")
             except Exception as e:
                 QMessageBox.critical(self, 'Terminal error', str(e))
             return
-        # yay is usable: split by source
-        cmds_text = []
+        # yay is usable: split by source. Labels are exactly 'Pacman' or 'Yay'
+        repo_names = []
+        aur_names = []
+        for name in names:
+            (repo_names if checked[name] == 'Pacman' else aur_names).append(name)
+        cmds = []
         if repo_names:
-            cmds_text.append(f"sudo pacman -Rns {' '.join(repo_names)}")
+            cmds.append(('sudo pacman -Rns', repo_names))
         if aur_names:
-            cmds_text.append(f"yay -Rns {' '.join(aur_names)}")
-        if not cmds_text:
+            cmds.append(('yay -Rns', aur_names))
+        if not cmds:
             QMessageBox.information(self, 'Nothing selected', 'No packages selected to uninstall.')
             return
-        if QMessageBox.question(self, 'Confirm uninstall', "Run:\n" + "\n".join(cmds_text)) != QMessageBox.Yes:
+        # The dialog gets a short preview; the terminal gets the full lists
+        preview = '\n'.join(f"{prefix} {preview_names(pkgs)}" for prefix, pkgs in cmds)
+        if QMessageBox.question(self, 'Confirm uninstall', "Run:\n" + preview) != QMessageBox.Yes:
             return
         try:
-            if shutil.which('konsole'):
-                if repo_names:
-                    self.term.run_konsole_direct(['sudo', 'pacman', '-Rns', *repo_names], keep_open=self.keep_konsole_open)
-                if aur_names:
-                    self.term.run_konsole_direct(['yay', '-Rns', *aur_names], keep_open=self.keep_konsole_open)
-            else:
-                # Fallback: run combined in default terminal sequentially
-                for cmdline in cmds_text:
-                    self.term.run(cmdline)
+            self._run_cmds(cmds)
         except Exception as e:
             QMessageBox.critical(self, 'Terminal error', str(e))
 